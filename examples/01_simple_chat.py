@@ -8,24 +8,43 @@ Usage:
     python examples/01_simple_chat.py
     python examples/01_simple_chat.py --provider gemini --model gemini-3-pro-preview
     python examples/01_simple_chat.py --provider openai --model gpt-4o-mini
+    python examples/01_simple_chat.py --history-turns 5
 """
 
 import argparse
+import asyncio
+import importlib.util
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Use src/ only when the package is not installed (pip install -e .)
+if importlib.util.find_spec("multi_agent") is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from loguru import logger
 
-from multi_agent.shared import create_llm, settings
+from multi_agent.shared import (
+    cached_system_message,
+    create_llm,
+    enable_llm_cache,
+    enable_prompt_cache,
+    get_text_extractor,
+    input_future,
+    settings,
+)
 from multi_agent.shared.config import LLMProvider
 from multi_agent.shared.memory import AgentMemory
 
+# Flush streamed output at newlines or after this many chunks
+STREAM_FLUSH_CHUNKS = 8
 
-def main():
+USER_PROMPT = "\n👤 You: "
+
+# Turns kept verbatim in the prompt; older turns are folded into a summary
+DEFAULT_HISTORY_TURNS = 10
+
+
+async def main():
     parser = argparse.ArgumentParser(description="Simple chat with LLM")
     parser.add_argument(
         "--provider",
@@ -34,6 +53,13 @@ def main():
         help="LLM provider (default: from settings)",
     )
     parser.add_argument("--model", default=None, help="Model to use")
+    parser.add_argument(
+        "--history-turns",
+        type=int,
+        default=DEFAULT_HISTORY_TURNS,
+        help=f"Turns sent verbatim to the LLM, older ones are summarized "
+        f"(default: {DEFAULT_HISTORY_TURNS})",
+    )
     args = parser.parse_args()
 
     # Configure provider
@@ -44,9 +70,18 @@ def main():
 
     model = args.model or settings.llm_model
 
-    print(f"\n🤖 Chat with {provider.value}:{model}")
-    print("=" * 50)
-    print("Type 'exit' or 'quit' to end, 'clear' to clear memory\n")
+    # Answer repeated prompts from the response cache
+    enable_llm_cache()
+
+    print(
+        "\n".join(
+            [
+                f"\n🤖 Chat with {provider.value}:{model}",
+                "=" * 50,
+                "Type 'exit' or 'quit' to end, 'clear' to clear memory\n",
+            ]
+        )
+    )
 
     # Create LLM and memory
     try:
@@ -61,19 +96,49 @@ def main():
             print("\nMake sure OPENAI_API_KEY is set in your .env file")
         return
 
-    memory = AgentMemory(agent_name="chat_agent")
-    memory.set_system_prompt(
+    # Keep the repeated system prompt + history prefix warm on the provider
+    llm = enable_prompt_cache(llm, "01_simple_chat", provider)
+
+    # One turn = user message + assistant reply
+    memory = AgentMemory(max_messages=2 * max(args.history_turns, 1), agent_name="chat_agent")
+
+    # Provider-specific chunk text extraction, chosen once
+    extract_text = get_text_extractor(llm)
+
+    # System message marked for provider-side prompt caching. It is kept
+    # out of memory, whose own system messages then hold only the summary.
+    system_message = cached_system_message(
         "You are a friendly and knowledgeable AI assistant. "
-        "Respond concisely but completely."
+        "Respond concisely but completely.",
+        provider,
     )
 
-    # Interactive chat loop
+    async def compress_history() -> None:
+        """When the window is full, replace its older half with a summary."""
+        if len(memory) < memory.max_messages:
+            return
+
+        try:
+            # max_tokens=0: the window size, not a token budget, triggers it
+            await memory.acompact(
+                llm, max_tokens=0, keep_recent=memory.max_messages // 2, keep_sinks=0
+            )
+        except Exception as e:
+            logger.warning(f"Could not summarize history, older turns will be dropped: {e}")
+
+    # Interactive chat loop. The next prompt may already be waiting
+    # (started while the previous reply was being saved).
+    next_input = None
     while True:
+        if next_input is None:
+            next_input = input_future(USER_PROMPT)
         try:
-            user_input = input("\n👤 You: ").strip()
+            user_input = (await next_input).strip()
         except (KeyboardInterrupt, EOFError):
             print("\n\n👋 Goodbye!")
             break
+        finally:
+            next_input = None
 
         if not user_input:
             continue
@@ -87,40 +152,33 @@ def main():
 
         # Add user message to memory
         memory.add_user(user_input)
-
-        # Prepare messages for LLM using proper LangChain message types
-        messages = []
-        if memory._system_prompt:
-            messages.append(SystemMessage(content=memory._system_prompt))
-
-        for msg in memory._messages:
-            if msg.role == "user":
-                messages.append(HumanMessage(content=msg.content))
-            elif msg.role == "assistant":
-                messages.append(AIMessage(content=msg.content))
+        messages = [system_message, *memory.langchain_messages()]
 
         # Generate response
         print(f"\n   🔄 generating request for {model}...", end="\r")
         print("\n🤖 Assistant: ", end="", flush=True)
         try:
-            # Streaming response
-            full_response = ""
-            for chunk in llm.stream(messages):
-                # Handle different response formats (Gemini returns list of dicts)
-                content = chunk.content if hasattr(chunk, "content") else str(chunk)
-                if isinstance(content, list):
-                    # Gemini format: [{'type': 'text', 'text': '...', 'index': 0}]
-                    content = "".join(
-                        item.get("text", "")
-                        for item in content
-                        if isinstance(item, dict) and item.get("type") == "text"
-                    )
-                print(content, end="", flush=True)
-                full_response += content
-            print()  # Final newline
-
-            # Save response to memory
+            # Streaming response, written in small batches instead of per token
+            parts = []
+            buf = []
+            async for chunk in llm.astream(messages):
+                content = extract_text(chunk)
+                buf.append(content)
+                if "\n" in content or len(buf) >= STREAM_FLUSH_CHUNKS:
+                    sys.stdout.write("".join(buf))
+                    sys.stdout.flush()
+                    parts.extend(buf)
+                    buf.clear()
+            parts.extend(buf)
+            sys.stdout.write("".join(buf) + "\n")  # Remaining chunks + final newline
+            sys.stdout.flush()
+            full_response = "".join(parts)
+
+            # Show the next prompt first so the user can start typing
+            # while the response is saved to memory
+            next_input = input_future(USER_PROMPT)
             memory.add_assistant(full_response)
+            await compress_history()
 
         except Exception as e:
             print(f"\n❌ Error: {e}")
@@ -128,4 +186,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\n\n👋 Goodbye!")
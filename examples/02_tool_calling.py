@@ -6,17 +6,34 @@ interact with the environment (calculations, files, time, etc.).
 
 Usage:
     python examples/02_tool_calling.py
+    python examples/02_tool_calling.py "What is 15 * 7?" "What time is it?"
+    python examples/02_tool_calling.py --single-prompt "What is 15 * 7?" "What time is it?"
 """
 
+import argparse
+import asyncio
+import importlib.util
+import re
 import sys
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Use src/ only when the package is not installed (pip install -e .)
+if importlib.util.find_spec("multi_agent") is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from langchain_core.messages import HumanMessage, SystemMessage, AIMessage, ToolMessage
+from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
 from loguru import logger
 
-from multi_agent.shared import create_llm
+from multi_agent.shared import (
+    ainput,
+    cached_system_message,
+    create_llm,
+    enable_llm_cache,
+    enable_prompt_cache,
+    message_text,
+)
 from multi_agent.tools import (
     calculate,
     get_current_time,
@@ -27,22 +44,8 @@ from multi_agent.tools import (
 )
 
 
-def main():
-    print("\n🛠️ Interactive Agent with Tool Calling")
-    print("=" * 50)
-    print("Type 'exit' or 'quit' to end the chat")
-    print("Ask questions that might require tools (math, time, files, search)\n")
-
-    # Create LLM with tools bound
-    llm = create_llm()
-    tools = ALL_TOOLS
-    llm_with_tools = llm.bind_tools(tools)
-
-    # Create tool lookup map
-    tool_map = {t.name: t for t in tools}
-
-    # System prompt instructing agent on tool usage
-    system_prompt = """You are an AI assistant with access to various tools.
+# System prompt instructing agent on tool usage
+SYSTEM_PROMPT = """You are an AI assistant with access to various tools.
 Use tools when necessary to answer questions accurately.
 
 Available tools:
@@ -55,13 +58,203 @@ Available tools:
 When you need to use a tool, call it. After receiving the tool result, 
 provide a helpful response to the user based on that result."""
 
+# Max LLM requests in flight when answering several queries at once
+MAX_CONCURRENCY = 4
+
+# Answer labels used when several queries share one prompt: [Q1], [Q2], ...
+ANSWER_LABEL = re.compile(r"^\s*\[Q(\d+)\]\s*", re.MULTILINE)
+
+
+async def run_tool_calls(tool_map: Mapping, tool_calls: list[dict]) -> list[ToolMessage]:
+    """
+    Execute the tool calls of one model turn concurrently.
+
+    Calls requested in the same turn are independent, so the turn takes as
+    long as the slowest tool instead of the sum of all of them.
+    Results are returned in the same order as `tool_calls`.
+    """
+
+    async def run_one(tc: dict) -> str:
+        tool = tool_map.get(tc["name"])
+        if tool is None:
+            return f"Tool '{tc['name']}' not found"
+        try:
+            return str(await tool.ainvoke(tc["args"]))
+        except Exception as e:
+            return f"Error executing tool: {e}"
+
+    results = await asyncio.gather(*(run_one(tc) for tc in tool_calls))
+    return [
+        ToolMessage(content=result, tool_call_id=tc["id"])
+        for tc, result in zip(tool_calls, results)
+    ]
+
+
+async def answer_queries(llm_with_tools, tool_map: Mapping, queries: list[str]) -> list[str]:
+    """
+    Answer independent queries concurrently.
+
+    Each query gets its own conversation. All conversations are sent in a
+    single `abatch` call per round, so LLM round-trips overlap instead of
+    running one after the other. Conversations that request tools are
+    resolved and batched again until every query has a final answer.
+    """
+    conversations = [
+        [cached_system_message(SYSTEM_PROMPT), HumanMessage(content=q)] for q in queries
+    ]
+    answers = [""] * len(queries)
+    pending = list(range(len(queries)))
+    config = {"max_concurrency": min(len(queries), MAX_CONCURRENCY)}
+
+    while pending:
+        responses = await llm_with_tools.abatch(
+            [conversations[i] for i in pending], config=config
+        )
+
+        still_pending = []
+        for i, response in zip(pending, responses):
+            conversations[i].append(response)
+
+            if not (hasattr(response, "tool_calls") and response.tool_calls):
+                answers[i] = message_text(response)
+                continue
+
+            for tc in response.tool_calls:
+                print(f"   → [Q{i + 1}] {tc['name']}: {tc['args']}")
+            still_pending.append(i)
+
+        # Run the tools of every pending conversation at the same time
+        tool_results = await asyncio.gather(
+            *(run_tool_calls(tool_map, conversations[i][-1].tool_calls) for i in still_pending)
+        )
+        for i, tool_messages in zip(still_pending, tool_results):
+            conversations[i].extend(tool_messages)
+
+        pending = still_pending
+
+    return answers
+
+
+def marshal_queries(queries: list[str]) -> str:
+    """Combine several queries into one prompt with labeled answers."""
+    numbered = "\n".join(f"[Q{i}] {q}" for i, q in enumerate(queries, 1))
+    return (
+        f"Answer the following {len(queries)} questions separately.\n"
+        "Start each answer on a new line with its label ([Q1], [Q2], ...).\n\n"
+        f"{numbered}"
+    )
+
+
+def split_answers(text: str, count: int) -> list[str] | None:
+    """Split a labeled response into answers, or None if labels are missing."""
+    parts = ANSWER_LABEL.split(text)
+    answers = {int(num): body.strip() for num, body in zip(parts[1::2], parts[2::2])}
+    if sorted(answers) != list(range(1, count + 1)):
+        return None
+    return [answers[i] for i in range(1, count + 1)]
+
+
+async def answer_in_one_prompt(
+    llm_with_tools, tool_map: Mapping, queries: list[str]
+) -> list[str] | None:
+    """
+    Answer several queries with a single conversation.
+
+    One prompt replaces N separate requests, so the system prompt and
+    round-trip are paid once. Returns None when the model does not label
+    its answers, so the caller can fall back to one request per query.
+    """
+    messages = [
+        cached_system_message(SYSTEM_PROMPT),
+        HumanMessage(content=marshal_queries(queries)),
+    ]
+    response = await llm_with_tools.ainvoke(messages)
+    messages.append(response)
+
+    while hasattr(response, "tool_calls") and response.tool_calls:
+        for tc in response.tool_calls:
+            print(f"   → {tc['name']}: {tc['args']}")
+        messages.extend(await run_tool_calls(tool_map, response.tool_calls))
+        response = await llm_with_tools.ainvoke(messages)
+        messages.append(response)
+
+    return split_answers(message_text(response), len(queries))
+
+
+async def run_batch(
+    llm_with_tools, tool_map: Mapping, queries: list[str], single_prompt: bool = False
+) -> None:
+    """Answer queries passed on the command line and print the results."""
+    try:
+        answers = None
+        if single_prompt and len(queries) > 1:
+            print(f"\n📋 Answering {len(queries)} queries in a single prompt...", flush=True)
+            answers = await answer_in_one_prompt(llm_with_tools, tool_map, queries)
+            if answers is None:
+                print("   ⚠️ Answers were not labeled, asking one query at a time")
+
+        if answers is None:
+            print(
+                f"\n📋 Answering {len(queries)} queries (max {MAX_CONCURRENCY} in flight)...",
+                flush=True,
+            )
+            answers = await answer_queries(llm_with_tools, tool_map, queries)
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        logger.exception("Error during batch tool calling")
+        return
+
+    print(
+        "\n".join(
+            f"\n👤 Q{i}: {query}\n🤖 Assistant: {answer}"
+            for i, (query, answer) in enumerate(zip(queries, answers), 1)
+        )
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Agent with tool calling")
+    parser.add_argument(
+        "queries", nargs="*", help="Questions to answer without starting the chat"
+    )
+    parser.add_argument(
+        "--single-prompt",
+        action="store_true",
+        help="Send all queries in one prompt instead of one request each",
+    )
+    args = parser.parse_args()
+
+    print("\n🛠️ Interactive Agent with Tool Calling\n" + "=" * 50)
+
+    # Answer repeated prompts from the response cache
+    enable_llm_cache()
+
+    # Create LLM with tools bound. Binding serializes every tool schema,
+    # so it is done once here and reused by all turns and batch queries.
+    llm = create_llm()
+    tools = tuple(ALL_TOOLS)
+    llm_with_tools = enable_prompt_cache(llm.bind_tools(tools), "02_tool_calling")
+
+    # Create read-only tool lookup map
+    tool_map = MappingProxyType({t.name: t for t in tools})
+
+    # Check if queries provided via command line
+    if args.queries:
+        await run_batch(llm_with_tools, tool_map, args.queries, args.single_prompt)
+        return
+
+    print(
+        "Type 'exit' or 'quit' to end the chat\n"
+        "Ask questions that might require tools (math, time, files, search)\n"
+    )
+
     # Conversation history
-    messages = [SystemMessage(content=system_prompt)]
+    messages = [cached_system_message(SYSTEM_PROMPT)]
 
     # Interactive chat loop
     while True:
         try:
-            user_input = input("\n👤 You: ").strip()
+            user_input = (await ainput("\n👤 You: ")).strip()
         except (KeyboardInterrupt, EOFError):
             print("\n\n👋 Goodbye!")
             break
@@ -77,52 +270,33 @@ provide a helpful response to the user based on that result."""
 
         # Call LLM - it may request tool calls
         try:
-            response = llm_with_tools.invoke(messages)
+            response = await llm_with_tools.ainvoke(messages)
             messages.append(response)
 
             # Process tool calls if any
             while hasattr(response, "tool_calls") and response.tool_calls:
                 print("\n🔧 Using tools...")
                 for tc in response.tool_calls:
-                    tool_name = tc["name"]
-                    tool_args = tc["args"]
-                    print(f"   → {tool_name}: {tool_args}")
-
-                    # Execute the tool
-                    if tool_name in tool_map:
-                        result = tool_map[tool_name].invoke(tool_args)
-                        print(
-                            f"   ✓ Result: {result[:100]}..."
-                            if len(str(result)) > 100
-                            else f"   ✓ Result: {result}"
-                        )
-
-                        # Add tool result to messages
-                        messages.append(
-                            ToolMessage(content=str(result), tool_call_id=tc["id"])
-                        )
-                    else:
-                        messages.append(
-                            ToolMessage(
-                                content=f"Tool '{tool_name}' not found",
-                                tool_call_id=tc["id"],
-                            )
-                        )
+                    print(f"   → {tc['name']}: {tc['args']}")
+
+                # Execute all tools of this turn concurrently
+                tool_messages = await run_tool_calls(tool_map, response.tool_calls)
+                for tm in tool_messages:
+                    result = tm.content
+                    print(
+                        f"   ✓ Result: {result[:100]}..."
+                        if len(result) > 100
+                        else f"   ✓ Result: {result}"
+                    )
+                messages.extend(tool_messages)
+                sys.stdout.flush()
 
                 # Get next response after tool execution
-                response = llm_with_tools.invoke(messages)
+                response = await llm_with_tools.ainvoke(messages)
                 messages.append(response)
 
             # Print final response
-            content = response.content
-            if isinstance(content, list):
-                # Gemini format: [{'type': 'text', 'text': '...', 'index': 0}]
-                content = "".join(
-                    item.get("text", "")
-                    for item in content
-                    if isinstance(item, dict) and item.get("type") == "text"
-                )
-            print(f"\n🤖 Assistant: {content}")
+            print(f"\n🤖 Assistant: {message_text(response)}")
 
         except Exception as e:
             print(f"\n❌ Error: {e}")
@@ -130,9 +304,11 @@ provide a helpful response to the user based on that result."""
             # Remove the last user message to avoid issues
             messages.pop()
 
-    print("\n" + "=" * 50)
-    print("✅ Chat ended!")
+    print("\n" + "=" * 50 + "\n✅ Chat ended!")
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\n\n👋 Goodbye!")
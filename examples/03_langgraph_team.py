@@ -13,35 +13,48 @@ Usage:
 """
 
 import asyncio
+import importlib.util
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Use src/ only when the package is not installed (pip install -e .)
+if importlib.util.find_spec("multi_agent") is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from loguru import logger
 
-from multi_agent.langgraph_agents import run_task
+from multi_agent.langgraph_agents import run_task_stream
+from multi_agent.shared import enable_llm_cache
 
 
 async def run_single_task(task: str):
     """Run a single task through the multi-agent team."""
-    print(f"\n📋 Task: {task}")
-    print("-" * 60)
-
-    print("\n🚀 Starting team...")
-    print("   Orchestrator → analyzes and delegates")
-    print("   Researcher → searches for info")
-    print("   Coder → implements")
-    print("   Reviewer → validates")
-    print("-" * 60 + "\n")
+    print(
+        "\n".join(
+            [
+                f"\n📋 Task: {task}",
+                "-" * 60,
+                "\n🚀 Starting team...",
+                "   Orchestrator → analyzes and delegates",
+                "   Researcher → searches for info",
+                "   Coder → implements",
+                "   Reviewer → validates",
+                "-" * 60 + "\n",
+            ]
+        ),
+        flush=True,
+    )
 
     try:
-        result = await run_task(task, max_iterations=8)
-
-        print("\n" + "=" * 60)
-        print("✅ FINAL RESULT:")
-        print("=" * 60)
-        print(result)
+        # Print each agent's output as it is generated
+        current_agent = None
+        async for agent, text in run_task_stream(task, max_iterations=8):
+            if agent != current_agent:
+                current_agent = agent
+                print(f"\n\n💬 {agent.capitalize()}:\n", end="")
+            print(text, end="", flush=True)
+
+        print("\n".join(["\n\n" + "=" * 60, "✅ Task completed", "=" * 60]))
         return True
 
     except Exception as e:
@@ -52,8 +65,10 @@ async def run_single_task(task: str):
 
 
 async def main():
-    print("\n🔷 Interactive Multi-Agent Team with LangGraph")
-    print("=" * 60)
+    print("\n🔷 Interactive Multi-Agent Team with LangGraph\n" + "=" * 60)
+
+    # Answer repeated prompts from the response cache
+    enable_llm_cache()
 
     # Check if task provided via command line
     if len(sys.argv) > 1:
@@ -62,8 +77,7 @@ async def main():
         return
 
     # Interactive mode
-    print("Enter tasks for the multi-agent team to work on.")
-    print("Type 'exit' or 'quit' to end.\n")
+    print("Enter tasks for the multi-agent team to work on.\nType 'exit' or 'quit' to end.\n")
 
     while True:
         try:
@@ -79,8 +93,7 @@ async def main():
             break
 
         await run_single_task(task)
-        print("\n" + "=" * 60)
-        print("Ready for next task...")
+        print("\n" + "=" * 60 + "\nReady for next task...")
 
 
 if __name__ == "__main__":
@@ -10,35 +10,47 @@ Usage:
 """
 
 import asyncio
+import importlib.util
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Use src/ only when the package is not installed (pip install -e .)
+if importlib.util.find_spec("multi_agent") is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from loguru import logger
 
-from multi_agent.autogen_agents import run_autogen_task
+from multi_agent.autogen_agents import run_autogen_stream_bytes
 
 
 async def run_single_task(task: str):
     """Run a single task through the AutoGen team."""
-    print(f"\n📋 Task: {task}")
-    print("-" * 60)
-
-    print("\n🚀 Starting AutoGen team...")
-    print("   ℹ️  The Scheduler will coordinate the following agents:")
-    print("      • Planner: Decomposition & Strategy")
-    print("      • Coder: implementation")
-    print("      • Reviewer: Quality Assurance")
-    print("-" * 60 + "\n")
+    print(
+        "\n".join(
+            [
+                f"\n📋 Task: {task}",
+                "-" * 60,
+                "\n🚀 Starting AutoGen team...",
+                "   ℹ️  The Scheduler will coordinate the following agents:",
+                "      • Planner: Decomposition & Strategy",
+                "      • Coder: implementation",
+                "      • Reviewer: Quality Assurance",
+                "-" * 60 + "\n",
+            ]
+        ),
+        flush=True,
+    )
 
     try:
-        result = await run_autogen_task(task)
-
-        print("\n" + "=" * 60)
-        print("✅ COMPLETE CONVERSATION:")
-        print("=" * 60)
-        print(result)
+        # Write each agent message as soon as it is produced; the messages
+        # arrive already encoded, so they go straight to the byte buffer
+        # (the text layer was flushed above)
+        out = sys.stdout.buffer
+        async for message in run_autogen_stream_bytes(task):
+            out.write(message + b"\n\n")
+            out.flush()
+
+        print("\n".join(["=" * 60, "✅ Conversation completed", "=" * 60]))
         return True
 
     except Exception as e:
@@ -49,8 +61,7 @@ async def run_single_task(task: str):
 
 
 async def main():
-    print("\n🔶 Interactive Multi-Agent Team with AutoGen")
-    print("=" * 60)
+    print("\n🔶 Interactive Multi-Agent Team with AutoGen\n" + "=" * 60)
 
     # Check if task provided via command line
     if len(sys.argv) > 1:
@@ -59,8 +70,7 @@ async def main():
         return
 
     # Interactive mode
-    print("Enter tasks for the AutoGen team to work on.")
-    print("Type 'exit' or 'quit' to end.\n")
+    print("Enter tasks for the AutoGen team to work on.\nType 'exit' or 'quit' to end.\n")
 
     while True:
         try:
@@ -76,8 +86,7 @@ async def main():
             break
 
         await run_single_task(task)
-        print("\n" + "=" * 60)
-        print("Ready for next task...")
+        print("\n" + "=" * 60 + "\nReady for next task...")
 
 
 if __name__ == "__main__":
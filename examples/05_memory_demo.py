@@ -11,22 +11,42 @@ Usage:
     python examples/05_memory_demo.py
 """
 
+import importlib.util
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Use src/ only when the package is not installed (pip install -e .)
+if importlib.util.find_spec("multi_agent") is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from loguru import logger
 
-from multi_agent.shared import create_llm
+from multi_agent.shared import create_llm, enable_llm_cache, get_text_extractor, settings
 from multi_agent.shared.memory import AgentMemory, SharedMemory, create_agent_memory
 
+# Flush streamed output at newlines or once this many characters are pending
+STREAM_FLUSH_CHARS = 64
+
+# Estimated prompt tokens before older chat turns are summarized
+MEMORY_TOKEN_BUDGET = 1500
+
+# On-disk location of the demo knowledge base (embedded once, reused by later runs)
+DEMO_CHROMA_PATH = settings.project_root / ".cache" / "chroma_demo"
+
+# Knowledge base used by the RAG demo
+DEMO_DOCUMENTS = [
+    "LangGraph is a framework for creating stateful agent graphs.",
+    "AutoGen is developed by Microsoft for conversational agents.",
+    "Ollama allows running LLMs locally on your own computer.",
+    "Python is a high-level programming language.",
+    "Google Gemini is a powerful multimodal AI model family.",
+]
+
 
 def demo_agent_memory():
     """Demo private agent memory."""
-    print("\n📝 Demo: Agent Memory (Conversational)")
-    print("-" * 50)
+    print("\n📝 Demo: Agent Memory (Conversational)\n" + "-" * 50)
 
     # Create memory with system prompt
     memory = create_agent_memory(
@@ -54,8 +74,7 @@ def demo_agent_memory():
 
 def demo_shared_memory():
     """Demo shared memory between agents."""
-    print("\n\n🔗 Demo: Shared Memory (Inter-Agent)")
-    print("-" * 50)
+    print("\n\n🔗 Demo: Shared Memory (Inter-Agent)\n" + "-" * 50)
 
     # Singleton - same instance everywhere
     shared = SharedMemory()
@@ -76,46 +95,55 @@ def demo_shared_memory():
     findings = shared.get("research_findings")
     print(f"  Coder read: {findings['patterns']}")
 
-    shared.append("task_log", "Researcher: analysis completed")
-    shared.append("task_log", "Coder: implemented Singleton")
-    shared.append("task_log", "Reviewer: code approved")
+    shared.extend(
+        "task_log",
+        [
+            "Researcher: analysis completed",
+            "Coder: implemented Singleton",
+            "Reviewer: code approved",
+        ],
+    )
 
     # Display log
     print("\nShared task log:")
-    for entry in shared.get("task_log", []):
-        print(f"  • {entry}")
+    print("\n".join(f"  • {entry}" for entry in shared.get("task_log", [])))
 
     # Cleanup
     shared.clear()
 
 
-def demo_simple_rag():
-    """Demo basic RAG with in-memory embeddings."""
-    print("\n\n🔍 Demo: Simple RAG (Knowledge Base)")
-    print("-" * 50)
-
-    try:
-        import chromadb
+@lru_cache(maxsize=1)
+def get_demo_collection():
+    """
+    Return the demo knowledge base collection.
 
-        # Create in-memory collection
-        client = chromadb.Client()
-        collection = client.create_collection("demo_kb")
+    The client and collection are created once and persisted on disk, and
+    documents are only embedded when the collection is still empty, so
+    later runs skip embedding entirely. Chroma's default embedding function
+    embeds all documents of an add() in one batch.
+    """
+    import chromadb
 
-        # Add documents
-        documents = [
-            "LangGraph is a framework for creating stateful agent graphs.",
-            "AutoGen is developed by Microsoft for conversational agents.",
-            "Ollama allows running LLMs locally on your own computer.",
-            "Python is a high-level programming language.",
-            "Google Gemini is a powerful multimodal AI model family.",
-        ]
+    client = chromadb.PersistentClient(path=str(DEMO_CHROMA_PATH))
+    collection = client.get_or_create_collection("demo_kb")
 
+    if collection.count() == 0:
         collection.add(
-            documents=documents,
-            ids=[f"doc_{i}" for i in range(len(documents))],
+            documents=DEMO_DOCUMENTS,
+            ids=[f"doc_{i}" for i in range(len(DEMO_DOCUMENTS))],
         )
 
-        print(f"Knowledge base created with {len(documents)} documents")
+    return collection
+
+
+def demo_simple_rag():
+    """Demo basic RAG with a persistent knowledge base."""
+    print("\n\n🔍 Demo: Simple RAG (Knowledge Base)\n" + "-" * 50, flush=True)
+
+    try:
+        collection = get_demo_collection()
+
+        print(f"Knowledge base ready with {collection.count()} documents")
 
         # Example query
         query = "How can I run AI models on my PC?"
@@ -123,8 +151,7 @@ def demo_simple_rag():
 
         print(f"\nQuery: '{query}'")
         print("Most relevant results:")
-        for i, doc in enumerate(results["documents"][0]):
-            print(f"  {i+1}. {doc}")
+        print("\n".join(f"  {i+1}. {doc}" for i, doc in enumerate(results["documents"][0])))
 
     except ImportError:
         print("ChromaDB not installed. Install with: pip install chromadb")
@@ -133,8 +160,7 @@ def demo_simple_rag():
 
 def interactive_memory_chat():
     """Interactive chat with memory demonstration."""
-    print("\n\n💬 Interactive Chat with Memory")
-    print("-" * 50)
+    print("\n\n💬 Interactive Chat with Memory\n" + "-" * 50)
     print("Chat with an AI that remembers context!")
     print(
         "Type 'exit' or 'quit' to end, 'clear' to clear memory, 'history' to see memory\n"
@@ -147,6 +173,9 @@ def interactive_memory_chat():
         print("Skipping interactive demo.")
         return
 
+    # Provider-specific chunk text extraction, chosen once
+    extract_text = get_text_extractor(llm)
+
     memory = AgentMemory(agent_name="memory_demo")
     memory.set_system_prompt(
         "You are a helpful assistant demonstrating memory capabilities. "
@@ -171,61 +200,60 @@ def interactive_memory_chat():
             continue
         if user_input.lower() == "history":
             print(f"\n📜 Memory contains {len(memory)} messages:")
-            for msg in memory._messages:
-                preview = (
-                    msg.content[:60] + "..." if len(msg.content) > 60 else msg.content
+            print(
+                "\n".join(
+                    f"   [{role}]: {preview}" for role, preview in memory.get_previews()
                 )
-                print(f"   [{msg.role}]: {preview}")
+            )
             continue
 
         # Add user message
         memory.add_user(user_input)
 
-        # Build messages
-        messages = []
-        if memory._system_prompt:
-            messages.append(SystemMessage(content=memory._system_prompt))
-        for msg in memory._messages:
-            if msg.role == "user":
-                messages.append(HumanMessage(content=msg.content))
-            elif msg.role == "assistant":
-                messages.append(AIMessage(content=msg.content))
+        # Summarize the middle of long conversations to bound prompt size
+        try:
+            if memory.compact(llm, max_tokens=MEMORY_TOKEN_BUDGET):
+                print("   🗜️ Older messages summarized to save context")
+        except Exception as e:
+            logger.warning(f"Memory compaction failed: {e}")
+
+        # Messages are kept in LangChain format by memory as they are added
+        messages = memory.langchain_messages()
 
         # Generate and stream response
         print("\n🤖 Assistant: ", end="", flush=True)
         try:
-            full_response = ""
+            # Streaming response, flushed in small batches instead of per token
+            parts: list[str] = []
+            pending = 0
             for chunk in llm.stream(messages):
-                # Handle different response formats (Gemini returns list of dicts)
-                content = chunk.content if hasattr(chunk, "content") else str(chunk)
-                if isinstance(content, list):
-                    content = "".join(
-                        item.get("text", "")
-                        for item in content
-                        if isinstance(item, dict) and item.get("type") == "text"
-                    )
-                print(content, end="", flush=True)
-                full_response += content
-            print()
-            memory.add_assistant(full_response)
+                content = extract_text(chunk)
+                parts.append(content)
+                sys.stdout.write(content)
+                pending += len(content)
+                if pending >= STREAM_FLUSH_CHARS or "\n" in content:
+                    sys.stdout.flush()
+                    pending = 0
+            sys.stdout.write("\n")
+            sys.stdout.flush()
+            memory.add_assistant("".join(parts))
         except Exception as e:
             print(f"\n❌ Error: {e}")
             logger.exception("Error during generation")
 
 
 def main():
-    print("\n" + "=" * 60)
-    print("🧠 Multi-Agent Memory System Demo")
-    print("=" * 60)
+    print("\n".join(["\n" + "=" * 60, "🧠 Multi-Agent Memory System Demo", "=" * 60]))
+
+    # Answer repeated prompts from the response cache
+    enable_llm_cache()
 
     demo_agent_memory()
     demo_shared_memory()
     demo_simple_rag()
     interactive_memory_chat()
 
-    print("\n" + "=" * 60)
-    print("✅ Demo completed!")
-    print("=" * 60)
+    print("\n".join(["\n" + "=" * 60, "✅ Demo completed!", "=" * 60]))
 
 
 if __name__ == "__main__":
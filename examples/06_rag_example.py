@@ -8,19 +8,36 @@ Usage:
     python examples/06_rag_example.py
 """
 
+from __future__ import annotations
+
+import hashlib
+import importlib.util
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Use src/ only when the package is not installed (pip install -e .)
+if importlib.util.find_spec("multi_agent") is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from loguru import logger
-from multi_agent.shared.rag import RAGStore, RAGAgent
+
+from multi_agent.shared import create_llm, settings
+
+# Knowledge base stored on disk, so later runs reuse the embeddings
+RAG_PERSIST_DIR = settings.project_root / ".cache" / "chroma"
+
+# chromadb is imported with the RAG module, so it is loaded only when used
+if TYPE_CHECKING:
+    from multi_agent.shared.rag import RAGStore
 
 
 def create_knowledge_base():
     """Create and populate the knowledge base."""
+    from multi_agent.shared.rag import RAGStore
+
     print("\n📚 Creating knowledge base...")
-    rag = RAGStore(collection_name="demo_knowledge")
+    rag = RAGStore(collection_name="demo_knowledge", persist_directory=str(RAG_PERSIST_DIR))
 
     # Add some documents
     documents = [
@@ -50,8 +67,17 @@ def create_knowledge_base():
         file operations, web searches, and code execution.""",
     ]
 
-    rag.add_documents(documents)
-    print(f"   Added {len(documents)} documents to knowledge base")
+    # Documents are stored under content-hash ids, so editing any of them
+    # (not only adding or removing one) triggers a rebuild. Embed only when
+    # the stored collection doesn't match the documents.
+    ids = [hashlib.sha256(doc.encode()).hexdigest()[:16] for doc in documents]
+    if set(rag.collection.get(include=[])["ids"]) != set(ids):
+        if rag.count:
+            rag.clear()
+        rag.add_documents(documents, ids=ids)
+        print(f"   Added {len(documents)} documents to knowledge base")
+    else:
+        print(f"   Reusing stored knowledge base from {RAG_PERSIST_DIR}")
     print(f"   Total documents: {rag.count}")
     return rag
 
@@ -65,9 +91,11 @@ def demo_semantic_search(rag: RAGStore):
         "How do I connect external tools to an AI assistant?",
     ]
 
-    for query in queries:
+    # One batched lookup for all queries
+    all_results = rag.search_batch(queries, n_results=2)
+
+    for query, results in zip(queries, all_results):
         print(f"\n   Query: '{query}'")
-        results = rag.search(query, n_results=2)
         print("   Top results:")
         for i, r in enumerate(results, 1):
             snippet = r["document"][:80].replace("\n", " ") + "..."
@@ -82,7 +110,10 @@ def interactive_rag_chat(rag: RAGStore):
     print("Type 'exit' or 'quit' to end, 'search <query>' for raw search\n")
 
     try:
-        agent = RAGAgent(rag_store=rag)
+        from multi_agent.shared.rag import RAGAgent
+
+        # Share one LLM client (and its connections) across all queries
+        agent = RAGAgent(rag_store=rag, llm=create_llm())
     except Exception as e:
         print(f"⚠️ Could not create RAG agent: {e}")
         print("   Make sure your LLM provider is configured correctly.")
@@ -136,9 +167,6 @@ def main():
     demo_semantic_search(rag)
     interactive_rag_chat(rag)
 
-    # Cleanup
-    rag.clear()
-
     print("\n" + "=" * 60)
     print("✅ RAG Demo completed!")
     print("=" * 60)
@@ -10,13 +10,43 @@ Usage:
     python examples/07_mcp_example.py
 """
 
+import asyncio
+import importlib.util
+import itertools
 import sys
+import time
 from pathlib import Path
 from datetime import datetime
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Use src/ only when the package is not installed (pip install -e .)
+if importlib.util.find_spec("multi_agent") is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from multi_agent.shared.mcp import MCPServer, MCPTool, MCPResource
+from multi_agent.shared.runtime import new_event_loop
+from multi_agent.tools import evaluate_expression
+
+# Characters accepted by the calculate tool, as a 256-byte translation
+# table mapping allowed bytes to 0 and everything else to 1
+CALC_ALLOWED_CHARS = "0123456789+-*/.() "
+_CALC_BITMAP = bytes(0 if chr(i) in CALC_ALLOWED_CHARS else 1 for i in range(256))
+
+# Last formatted timestamp, reused until the wall-clock second changes
+_now_cache: tuple[int, str] = (-1, "")
+
+
+def format_now() -> str:
+    """Current local time as YYYY-MM-DD HH:MM:SS, formatted once per second."""
+    global _now_cache
+    second = int(time.time())
+    if second != _now_cache[0]:
+        n = datetime.fromtimestamp(second)
+        _now_cache = (
+            second,
+            f"{n.year:04d}-{n.month:02d}-{n.day:02d} "
+            f"{n.hour:02d}:{n.minute:02d}:{n.second:02d}",
+        )
+    return _now_cache[1]
 
 
 def create_mcp_server():
@@ -40,11 +70,10 @@ def create_mcp_server():
     )
     def calculate(expression: str) -> str:
         try:
-            allowed = set("0123456789+-*/.() ")
-            if not all(c in allowed for c in expression):
+            # Non-ASCII characters become "?", which is rejected too
+            if b"\x01" in expression.encode("ascii", "replace").translate(_CALC_BITMAP):
                 return "Error: Only numbers and operators +-*/ allowed"
-            result = eval(expression)
-            return f"Result: {result}"
+            return f"Result: {evaluate_expression(expression)}"
         except Exception as e:
             return f"Error: {e}"
 
@@ -54,7 +83,7 @@ def create_mcp_server():
         input_schema={"type": "object", "properties": {}},
     )
     def get_time() -> str:
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return format_now()
 
     @server.tool(
         name="greet",
@@ -106,8 +135,6 @@ def demo_mcp_protocol(server):
 
     print("\n\n🔄 Simulating MCP Protocol Messages...")
 
-    # Initialize
-    print("\n1️⃣ Initialize:")
     init_request = {
         "jsonrpc": "2.0",
         "id": 1,
@@ -117,8 +144,37 @@ def demo_mcp_protocol(server):
             "clientInfo": {"name": "test-client", "version": "1.0.0"},
         },
     }
-    response = server.handle_message(init_request)
-    print(f"   Server: {response['result']['serverInfo']['name']}")
+    list_request = {"jsonrpc": "2.0", "id": 2, "method": "tools/list"}
+    call_request = {
+        "jsonrpc": "2.0",
+        "id": 3,
+        "method": "tools/call",
+        "params": {"name": "greet", "arguments": {"name": "MCP"}},
+    }
+    list_resources = {"jsonrpc": "2.0", "id": 4, "method": "resources/list"}
+    read_request = {
+        "jsonrpc": "2.0",
+        "id": 5,
+        "method": "resources/read",
+        "params": {"uri": "file://config.json"},
+    }
+
+    # Send every request in one JSON-RPC batch, dispatched concurrently on
+    # uvloop's event loop when installed, and match responses by id
+    batch = [init_request, list_request, call_request, list_resources, read_request]
+    with asyncio.Runner(loop_factory=new_event_loop) as runner:
+        responses = {r["id"]: r for r in runner.run(server.ahandle_batch(batch))}
+
+    print("\n1️⃣ Initialize:")
+    print(f"   Server: {responses[1]['result']['serverInfo']['name']}")
+    print("\n2️⃣ tools/list:")
+    print(f"   Tools: {', '.join(t['name'] for t in responses[2]['result']['tools'])}")
+    print("\n3️⃣ tools/call greet:")
+    print(f"   Result: {responses[3]['result']['content'][0]['text']}")
+    print("\n4️⃣ resources/list:")
+    print(f"   Resources: {', '.join(r['uri'] for r in responses[4]['result']['resources'])}")
+    print("\n5️⃣ resources/read:")
+    print(f"   Content: {responses[5]['result']['contents'][0]['text']}")
 
 
 def interactive_mcp_testing(server):
@@ -131,6 +187,17 @@ def interactive_mcp_testing(server):
     print("  resource <uri>    - Read a resource")
     print("  exit/quit         - Exit the demo\n")
 
+    # First declared parameter of each tool, which receives the typed argument
+    first_params = {
+        name: next(iter(tool.input_schema.get("properties", {})), None)
+        for name, tool in server.tools.items()
+    }
+
+    # JSON-RPC envelopes reused for every request; only id and params change
+    request_ids = itertools.count(100)
+    call_request = {"jsonrpc": "2.0", "id": None, "method": "tools/call", "params": None}
+    read_request = {"jsonrpc": "2.0", "id": None, "method": "resources/read", "params": None}
+
     while True:
         try:
             user_input = input("\n🔌 MCP> ").strip()
@@ -161,22 +228,11 @@ def interactive_mcp_testing(server):
                 continue
 
             # Build arguments based on tool schema
-            tool = server.tools[tool_name]
-            schema = tool.input_schema
-            props = schema.get("properties", {})
+            first_param = first_params.get(tool_name)
+            arguments = {first_param: arg_value} if first_param else {}
 
-            if props:
-                first_param = list(props.keys())[0]
-                arguments = {first_param: arg_value}
-            else:
-                arguments = {}
-
-            call_request = {
-                "jsonrpc": "2.0",
-                "id": 99,
-                "method": "tools/call",
-                "params": {"name": tool_name, "arguments": arguments},
-            }
+            call_request["id"] = next(request_ids)
+            call_request["params"] = {"name": tool_name, "arguments": arguments}
             print(f"\n   📤 Sending JSON-RPC Request:")
             print(f"      Method: tools/call")
             print(f"      Params: {call_request['params']}")
@@ -188,22 +244,19 @@ def interactive_mcp_testing(server):
                 print(f"      Error: {response['error']}")
             else:
                 print(f"      Result: {response['result']}")
-            result = response["result"]["content"][0]["text"]
-            print(f"✅ Result: {result}")
+                result = response["result"]["content"][0]["text"]
+                print(f"✅ Result: {result}")
 
         elif cmd == "resource" and len(parts) >= 2:
             uri = parts[1]
-            read_request = {
-                "jsonrpc": "2.0",
-                "id": 99,
-                "method": "resources/read",
-                "params": {"uri": uri},
-            }
+            read_request["id"] = next(request_ids)
+            read_request["params"] = {"uri": uri}
             response = server.handle_message(read_request)
             if "error" in response:
                 print(f"❌ Error: {response['error']['message']}")
             else:
-                content = response["result"]["contents"][0]["text"]
+                entry = response["result"]["contents"][0]
+                content = entry.get("text", f"<{len(entry.get('blob', ''))} base64 chars>")
                 print(f"📄 Content: {content}")
 
         else:
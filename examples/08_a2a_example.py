@@ -14,11 +14,20 @@ Usage:
     python examples/08_a2a_example.py
 """
 
+import importlib.util
+import re
 import sys
+import time
 import asyncio
+import hashlib
+from collections import OrderedDict, defaultdict
+from functools import cache
 from pathlib import Path
+from types import MappingProxyType
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Use src/ only when the package is not installed (pip install -e .)
+if importlib.util.find_spec("multi_agent") is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from multi_agent.shared.a2a import (
     AgentCard,
@@ -28,6 +37,25 @@ from multi_agent.shared.a2a import (
     A2AServer,
     AgentNetwork,
 )
+from multi_agent.shared.console import ainput
+
+# Maximum number of messages in flight during a broadcast
+BROADCAST_CONCURRENCY = 8
+
+# Icon shown next to each task state
+STATUS_ICONS = MappingProxyType(
+    {
+        TaskState.PENDING: "⏳",
+        TaskState.RUNNING: "🔄",
+        TaskState.COMPLETED: "✅",
+        TaskState.FAILED: "❌",
+        TaskState.CANCELLED: "🚫",
+    }
+)
+
+# Task result cache: LRU bound and time-to-live in seconds
+TASK_CACHE_MAX = 1024
+TASK_CACHE_TTL = 300.0
 
 
 # Define specialized agents
@@ -58,33 +86,28 @@ AGENTS = {
     ),
 }
 
+# Skill -> agents that advertise it, for O(1) skill-based routing
+SKILL_INDEX: defaultdict[str, list[AgentCard]] = defaultdict(list)
+for _card in AGENTS.values():
+    for _skill in _card.skills:
+        SKILL_INDEX[_skill.lower()].append(_card)
 
-def demo_agent_cards():
-    """Demonstrate Agent Card concept."""
-    print("\n📇 Agent Cards - Agent Identity & Capabilities")
-    print("-" * 50)
 
-    for card in AGENTS.values():
-        print(f"\n   🤖 {card.name.upper()}")
-        print(f"      Description: {card.description}")
-        print(f"      URL: {card.url}")
-        print(f"      Skills: {', '.join(card.skills)}")
+def route(skill: str) -> list[AgentCard]:
+    """Return the agents that have a skill."""
+    return SKILL_INDEX.get(skill.lower(), [])
 
 
-def demo_network_topology():
-    """Show agent network topology."""
-    print("\n\n🌐 Agent Network Topology")
-    print("-" * 50)
-    print(
-        """
+# Agent network diagram printed by demo_network_topology
+NETWORK_TOPOLOGY = """
    ┌─────────────────────────────────────────────────────┐
-   │                   Agent Network                      │
-   │                                                      │
-   │  ┌──────────┐   ┌──────────┐   ┌──────────┐        │
-   │  │Researcher│   │  Coder   │   │ Reviewer │        │
-   │  │ :8001    │   │  :8002   │   │  :8003   │        │
-   │  │[research]│   │ [python] │   │ [review] │        │
-   │  └────┬─────┘   └────┬─────┘   └────┬─────┘        │
+   │                   Agent Network                     │
+   │                                                     │
+   │  ┌──────────┐   ┌──────────┐   ┌──────────┐         │
+   │  │Researcher│   │  Coder   │   │ Reviewer │         │
+   │  │ :8001    │   │  :8002   │   │  :8003   │         │
+   │  │[research]│   │ [python] │   │ [review] │         │
+   │  └────┬─────┘   └────┬─────┘   └────┬─────┘         │
    │       │              │              │               │
    │       └──────────────┼──────────────┘               │
    │                      │                              │
@@ -93,8 +116,36 @@ def demo_network_topology():
    │              │    (you)      │                      │
    │              └───────────────┘                      │
    └─────────────────────────────────────────────────────┘
-    """
-    )
+"""
+
+
+@cache
+def _skills_str(name: str) -> str:
+    """Comma-separated skills of an agent; AGENTS is fixed for the session."""
+    return ", ".join(AGENTS[name].skills)
+
+
+def demo_agent_cards():
+    """Demonstrate Agent Card concept."""
+    print("\n📇 Agent Cards - Agent Identity & Capabilities")
+    print("-" * 50)
+
+    lines = []
+    for card in AGENTS.values():
+        lines += [
+            f"\n   🤖 {card.name.upper()}",
+            f"      Description: {card.description}",
+            f"      URL: {card.url}",
+            f"      Skills: {_skills_str(card.name)}",
+        ]
+    print("\n".join(lines))
+
+
+def demo_network_topology():
+    """Show agent network topology."""
+    print("\n\n🌐 Agent Network Topology")
+    print("-" * 50)
+    print(NETWORK_TOPOLOGY)
 
 
 def simulate_task_execution(agent_name: str, task_desc: str) -> str:
@@ -115,95 +166,219 @@ def simulate_task_execution(agent_name: str, task_desc: str) -> str:
     return f"Task completed: {task_desc}"
 
 
-def interactive_a2a_orchestrator():
+# (agent, task digest) -> (expiry time, result), oldest first
+_task_cache: OrderedDict[tuple[str, bytes], tuple[float, str]] = OrderedDict()
+
+
+def cached_task_execution(agent_name: str, task_desc: str) -> tuple[str, bool]:
+    """
+    Run a task through the result cache.
+
+    Returns:
+        Tuple of (result, whether it came from the cache)
+    """
+    key = (agent_name, hashlib.blake2b(task_desc.encode(), digest_size=16).digest())
+    now = time.monotonic()
+
+    entry = _task_cache.get(key)
+    if entry is not None and entry[0] > now:
+        _task_cache.move_to_end(key)
+        return entry[1], True
+
+    result = simulate_task_execution(agent_name, task_desc)
+    _task_cache[key] = (now + TASK_CACHE_TTL, result)
+    _task_cache.move_to_end(key)
+    if len(_task_cache) > TASK_CACHE_MAX:
+        _task_cache.popitem(last=False)
+    return result, False
+
+
+async def send_message(
+    agent_name: str, content: str, semaphore: asyncio.Semaphore
+) -> A2AMessage:
+    """Simulate delivering a message to an agent, bounded by the semaphore."""
+    async with semaphore:
+        message = A2AMessage(sender="orchestrator", receiver=agent_name, content=content)
+        # Stand-in for the network round trip to the agent's /messages endpoint
+        await asyncio.sleep(0)
+        return message
+
+
+UNKNOWN_COMMAND = "❓ Unknown command. Try 'agents', 'send <agent> <task>', or 'exit'"
+
+# Orchestrator commands: the name and the rest of the line
+_CMD_RE = re.compile(
+    r"^(?P<cmd>agents|send|route|broadcast|log|cache|exit|quit)(?:\s+(?P<rest>.*))?$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_broadcast_limit = asyncio.Semaphore(BROADCAST_CONCURRENCY)
+
+
+async def _do_agents(rest: str, task_log: list[dict]) -> None:
+    """List all agents and their skills."""
+    lines = ["\n📋 Available Agents:"]
+    for name, card in AGENTS.items():
+        lines += [
+            f"   • {name}: {card.description}",
+            f"     Skills: {_skills_str(name)}",
+        ]
+    print("\n".join(lines))
+
+
+async def _do_send(rest: str, task_log: list[dict]) -> None:
+    """Send a task to one agent and record the result."""
+    parts = rest.split(maxsplit=1)
+    if len(parts) < 2:
+        print(UNKNOWN_COMMAND)
+        return
+
+    agent_name = parts[0].lower()
+    task_desc = parts[1]
+
+    if agent_name not in AGENTS:
+        print(f"❌ Unknown agent: {agent_name}")
+        print(f"   Available: {', '.join(AGENTS.keys())}")
+        return
+
+    await _dispatch_task(agent_name, task_desc, task_log)
+
+
+async def _do_route(rest: str, task_log: list[dict]) -> None:
+    """Send a task to the first agent that has the requested skill."""
+    parts = rest.split(maxsplit=1)
+    if len(parts) < 2:
+        print(UNKNOWN_COMMAND)
+        return
+
+    skill, task_desc = parts
+    agents = route(skill)
+    if not agents:
+        print(f"❌ No agent has skill: {skill}")
+        print(f"   Known skills: {', '.join(sorted(SKILL_INDEX))}")
+        return
+
+    print(f"\n🧭 Routing '{skill}' to {agents[0].name}")
+    await _dispatch_task(agents[0].name, task_desc, task_log)
+
+
+async def _dispatch_task(agent_name: str, task_desc: str, task_log: list[dict]) -> None:
+    """Simulate sending a task to an agent and record the result."""
+    # Create and "send" task
+    task = A2ATask(description=task_desc)
+    # Simulate processing
+    task.state = TaskState.RUNNING
+    print(
+        "\n".join(
+            [
+                f"\n📤 Sending task to {agent_name}...",
+                f"   Task ID: {task.id[:8]}...",
+                f"   Description: {task_desc}",
+                f"   Status: {STATUS_ICONS[task.state]} {task.state.value}",
+                f"   📡 Connecting to {agent_name} at {AGENTS[agent_name].url}...",
+                "   ⏳ Waiting for agent response...",
+            ]
+        ),
+        flush=True,
+    )
+
+    # Get "result", reusing a recent answer to the same task. Nothing in
+    # it blocks, so it runs on the loop and _task_cache stays single-threaded.
+    result, cached = cached_task_execution(agent_name, task_desc)
+    task.state = TaskState.COMPLETED
+    task.result = result
+
+    source = " (cached)" if cached else ""
+    print(f"\n✅ Task completed{source}!\n   Result: {result}")
+
+    task_log.append(
+        {
+            "agent": agent_name,
+            "task": task_desc,
+            "result": result[:50] + "..." if len(result) > 50 else result,
+        }
+    )
+
+
+async def _do_broadcast(rest: str, task_log: list[dict]) -> None:
+    """Send a message to every agent concurrently."""
+    message = rest or "Hello agents!"
+    print(f"\n📢 Broadcasting to all agents: '{message}'")
+    sent = await asyncio.gather(
+        *(send_message(name, message, _broadcast_limit) for name in AGENTS)
+    )
+    print("\n".join(f"   ✓ Sent to {msg.receiver}" for msg in sent))
+
+
+async def _do_log(rest: str, task_log: list[dict]) -> None:
+    """Show the tasks sent so far."""
+    if not task_log:
+        print("📜 No tasks executed yet.")
+        return
+    print("\n📜 Task Log:")
+    print(
+        "\n".join(
+            f"   {i}. [{entry['agent']}] {entry['task']}"
+            for i, entry in enumerate(task_log, 1)
+        )
+    )
+
+
+async def _do_cache(rest: str, task_log: list[dict]) -> None:
+    """Show the task cache size, or empty it with 'cache clear'."""
+    if rest.strip().lower() == "clear":
+        _task_cache.clear()
+        print("🧹 Task cache cleared.")
+    else:
+        print(f"🗃️ Task cache: {len(_task_cache)}/{TASK_CACHE_MAX} entries")
+
+
+_HANDLERS = {
+    "agents": _do_agents,
+    "send": _do_send,
+    "route": _do_route,
+    "broadcast": _do_broadcast,
+    "log": _do_log,
+    "cache": _do_cache,
+}
+
+
+async def interactive_a2a_orchestrator():
     """Interactive A2A orchestrator simulation."""
     print("\n\n💬 Interactive A2A Orchestrator")
     print("-" * 50)
     print("Simulate delegating tasks to agents in the network!")
     print("\nCommands:")
-    print("  agents              - List all agents and their skills")
-    print("  send <agent> <task> - Send a task to an agent")
-    print("  broadcast <message> - Send message to all agents")
-    print("  exit/quit           - Exit the demo\n")
+    print("  agents               - List all agents and their skills")
+    print("  send <agent> <task>  - Send a task to an agent")
+    print("  route <skill> <task> - Send a task to an agent with that skill")
+    print("  broadcast <message>  - Send message to all agents")
+    print("  cache [clear]        - Show or clear cached task results")
+    print("  exit/quit            - Exit the demo\n")
 
     task_log = []
 
     while True:
         try:
-            user_input = input("\n🎯 Orchestrator> ").strip()
+            user_input = (await ainput("\n🎯 Orchestrator> ")).strip()
         except (KeyboardInterrupt, EOFError):
             print("\n\n👋 Goodbye!")
             break
 
         if not user_input:
             continue
-        if user_input.lower() in ("exit", "quit"):
+
+        match = _CMD_RE.match(user_input)
+        if match is None:
+            print(UNKNOWN_COMMAND)
+            continue
+
+        cmd = match["cmd"].lower()
+        if cmd in ("exit", "quit"):
             print("\n👋 Goodbye!")
             break
 
-        parts = user_input.split(maxsplit=2)
-        cmd = parts[0].lower()
-
-        if cmd == "agents":
-            print("\n📋 Available Agents:")
-            for name, card in AGENTS.items():
-                print(f"   • {name}: {card.description}")
-                print(f"     Skills: {', '.join(card.skills)}")
-
-        elif cmd == "send" and len(parts) >= 3:
-            agent_name = parts[1].lower()
-            task_desc = parts[2]
-
-            if agent_name not in AGENTS:
-                print(f"❌ Unknown agent: {agent_name}")
-                print(f"   Available: {', '.join(AGENTS.keys())}")
-                continue
-
-            # Create and "send" task
-            task = A2ATask(description=task_desc)
-            print(f"\n📤 Sending task to {agent_name}...")
-            print(f"   Task ID: {task.id[:8]}...")
-            print(f"   Description: {task_desc}")
-
-            # Simulate processing
-            task.state = TaskState.RUNNING
-            print(f"   Status: {task.state.value}")
-
-            print(f"   📡 Connecting to {agent_name} at {AGENTS[agent_name].url}...")
-            print(f"   ⏳ Waiting for agent response...")
-
-            # Get "result"
-            result = simulate_task_execution(agent_name, task_desc)
-            task.state = TaskState.COMPLETED
-            task.result = result
-
-            print(f"\n✅ Task completed!")
-            print(f"   Result: {result}")
-
-            task_log.append(
-                {
-                    "agent": agent_name,
-                    "task": task_desc,
-                    "result": result[:50] + "..." if len(result) > 50 else result,
-                }
-            )
-
-        elif cmd == "broadcast":
-            message = " ".join(parts[1:]) if len(parts) > 1 else "Hello agents!"
-            print(f"\n📢 Broadcasting to all agents: '{message}'")
-            for name in AGENTS:
-                print(f"   ✓ Sent to {name}")
-
-        elif cmd == "log":
-            if not task_log:
-                print("📜 No tasks executed yet.")
-            else:
-                print("\n📜 Task Log:")
-                for i, entry in enumerate(task_log, 1):
-                    print(f"   {i}. [{entry['agent']}] {entry['task']}")
-
-        else:
-            print("❓ Unknown command. Try 'agents', 'send <agent> <task>', or 'exit'")
+        await _HANDLERS[cmd](match["rest"] or "", task_log)
 
 
 def main():
@@ -213,7 +388,10 @@ def main():
 
     demo_agent_cards()
     demo_network_topology()
-    interactive_a2a_orchestrator()
+    try:
+        asyncio.run(interactive_a2a_orchestrator())
+    except KeyboardInterrupt:
+        print("\n\n👋 Goodbye!")
 
     print("\n" + "=" * 60)
     print("✅ A2A Demo completed!")
@@ -4,7 +4,11 @@ Launcher script for Multi-Agent System Examples.
 """
 import os
 import sys
+import json
 import subprocess
+import urllib.request
+from urllib.error import URLError
+from functools import lru_cache
 from pathlib import Path
 
 # ANSI colors
@@ -15,81 +19,172 @@ RED = "\033[91m"
 RESET = "\033[0m"
 BOLD = "\033[1m"
 CYAN = "\033[96m"
+CLEAR_SCREEN = "\033[2J\033[H"
+
+# Fixed menu fragments, assembled once
+_HEADER_TITLE = (
+    f"\n{BLUE}{BOLD}{'=' * 60}\n"
+    "   🤖 Multi-Agent System - Example Launcher\n"
+    f"{'=' * 60}{RESET}\n"
+)
+_SEP = f"{BLUE}{'=' * 60}{RESET}\n\n"
+_EXAMPLES_TITLE = f"{BOLD}Examples:{RESET}\n"
+_TOOLS_MENU = (
+    f"\n{BOLD}Tools:{RESET}\n"
+    f"  {BLUE}[S]{RESET} Select/Change Model\n"
+    f"  {BLUE}[M]{RESET} Pull New Model\n"
+    f"  {RED}[Q]{RESET} Quit\n"
+)
+
+ENV_PATH = Path(".env")
+
+
+@lru_cache(maxsize=1)
+def _load_dotenv(path, mtime):
+    """Parse a .env file into a dict; cached until its mtime changes."""
+    values = {}
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        key, sep, value = line.partition("=")
+        key = key.strip()
+        if sep and key and not key.startswith("#"):
+            values[key] = value.strip()
+    return values
+
+
+def _dotenv():
+    """Get the parsed .env values (empty if the file is missing or unreadable)."""
+    try:
+        return _load_dotenv(str(ENV_PATH), ENV_PATH.stat().st_mtime)
+    except (OSError, UnicodeDecodeError):
+        return {}
+
 
 # Global state
-# Try to get default from env, otherwise fallback to Gemini Flash
-CURRENT_MODEL = os.getenv("LLM_MODEL", "gemini-2.5-flash-lite")
-if Path(".env").exists():
-    with open(".env", "r") as f:
-        for line in f:
-            if line.startswith("LLM_MODEL="):
-                CURRENT_MODEL = line.split("=", 1)[1].strip()
-                break
+# Try to get default from .env or env, otherwise fallback to Gemini Flash
+# Model names are interned so the menu's `m == CURRENT_MODEL` checks hit
+# the identity fast path
+CURRENT_MODEL = sys.intern(
+    _dotenv().get("LLM_MODEL", os.getenv("LLM_MODEL", "gemini-2.5-flash-lite"))
+)
+
+
+def header_parts():
+    """Get the header as string fragments."""
+    return [_HEADER_TITLE, f"   Current Model: {CYAN}{CURRENT_MODEL}{RESET}\n", _SEP]
+
 
+EXAMPLES_DIR = "examples"
 
-def print_header():
-    print(f"\n{BLUE}{BOLD}" + "=" * 60)
-    print("   🤖 Multi-Agent System - Example Launcher")
-    print("=" * 60 + f"{RESET}")
-    print(f"   Current Model: {CYAN}{CURRENT_MODEL}{RESET}")
-    print(f"{BLUE}" + "=" * 60 + f"{RESET}\n")
+
+@lru_cache(maxsize=4)
+def _scan_examples(examples_dir, mtime):
+    """List numbered example scripts; cached until the directory changes."""
+    with os.scandir(examples_dir) as entries:
+        names = sorted(
+            e.name
+            for e in entries
+            if e.name[:1].isdigit() and e.name.endswith(".py") and e.is_file()
+        )
+    return tuple(Path(examples_dir, name) for name in names)
 
 
 def get_examples():
     """Get list of example scripts."""
-    examples_dir = Path("examples")
-    files = sorted(examples_dir.glob("[0-9]*.py"))
-    return [f for f in files]
+    try:
+        return _scan_examples(EXAMPLES_DIR, os.stat(EXAMPLES_DIR).st_mtime)
+    except OSError:
+        return ()
+
+
+# Ollama models from the last successful /api/tags call
+_ollama_models_cache = None
+
+
+def get_ollama_host():
+    """Get the Ollama server URL from env or .env."""
+    host = os.getenv("OLLAMA_HOST") or _dotenv().get("OLLAMA_HOST")
+    host = (host or "http://localhost:11434").rstrip("/")
+    # Ollama itself accepts a bare "host:port"; urllib needs a scheme
+    if "://" not in host:
+        host = f"http://{host}"
+    return host
 
 
 def get_ollama_models():
-    """Get list of available Ollama models."""
+    """Get list of available Ollama models (cached for the session)."""
+    global _ollama_models_cache
+    if _ollama_models_cache is not None:
+        return _ollama_models_cache
+
     try:
-        # Run ollama list
-        # output format is: NAME    ID    SIZE    MODIFIED
-        result = subprocess.run(
-            ["ollama", "list"], capture_output=True, text=True, check=True
-        )
-        lines = result.stdout.strip().split("\n")[1:]  # Skip header
-        return [line.split()[0] for line in lines if line.strip()]
-    except (FileNotFoundError, subprocess.SubprocessError):
+        # Ask the server directly instead of spawning `ollama list`
+        with urllib.request.urlopen(f"{get_ollama_host()}/api/tags", timeout=2) as resp:
+            data = json.loads(resp.read())
+    except (URLError, OSError, ValueError):
         return []
 
+    _ollama_models_cache = [sys.intern(m["name"]) for m in data.get("models", [])]
+    return _ollama_models_cache
+
+
+# Remote models offered when the provider's API key is configured
+REMOTE_MODELS = {
+    "gemini": (
+        "gemini-3-flash-preview",
+        "gemini-3-pro-preview",
+        "gemini-2.5-flash-lite",
+        "gemini-2.0-flash",
+        "gemini-1.5-pro",
+    ),
+    "openai": ("gpt-4o", "gpt-4o-mini", "gpt-4-turbo"),
+    "anthropic": ("claude-3-5-sonnet-20241022", "claude-3-haiku-20240307"),
+}
+
+# API key that enables each provider's remote models
+_PROVIDER_KEYS = {
+    "gemini": "GOOGLE_API_KEY",
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+}
+
 
 def get_remote_models():
     """Get list of configured remote models."""
-    models = []
-    # Check for API keys in env
-    env_content = ""
-    if Path(".env").exists():
-        try:
-            env_content = Path(".env").read_text(encoding="utf-8")
-        except Exception:
-            pass
-
-    has_google = "GOOGLE_API_KEY" in os.environ or "GOOGLE_API_KEY" in env_content
-    has_openai = "OPENAI_API_KEY" in os.environ or "OPENAI_API_KEY" in env_content
-    has_anthropic = (
-        "ANTHROPIC_API_KEY" in os.environ or "ANTHROPIC_API_KEY" in env_content
+    # Check for API keys in env or .env
+    dotenv = _dotenv()
+    providers = frozenset(
+        provider
+        for provider, key in _PROVIDER_KEYS.items()
+        if key in os.environ or key in dotenv
     )
 
-    if has_google:
-        models.extend(
-            [
-                "gemini-3-flash-preview",
-                "gemini-3-pro-preview",
-                "gemini-2.5-flash-lite",
-                "gemini-2.0-flash",
-                "gemini-1.5-pro",
-            ]
-        )
+    return [
+        model
+        for provider, models in REMOTE_MODELS.items()
+        if provider in providers
+        for model in models
+    ]
 
-    if has_openai:
-        models.extend(["gpt-4o", "gpt-4o-mini", "gpt-4-turbo"])
-    if has_anthropic:
-        models.extend(["claude-3-5-sonnet-20241022", "claude-3-haiku-20240307"])
 
-    return models
+# Environment for example runs, copied once; unbuffered so output streams
+_ENV_TEMPLATE = {**os.environ, "PYTHONUNBUFFERED": "1"}
+
+
+def _prompt(msg=""):
+    """
+    Read one line of user input.
+
+    A terminal keeps input() and its line editing; piped or scripted input
+    is read straight from stdin without going through readline.
+    """
+    if sys.stdin.isatty():
+        return input(msg)
+    sys.stdout.write(msg)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
 
 
 def run_script(script_path):
@@ -97,17 +192,41 @@ def run_script(script_path):
     print(f"\n{YELLOW}▶ Running {script_path} with model {CURRENT_MODEL}...{RESET}\n")
 
     # Inject current model into environment
-    env = os.environ.copy()
-    env["LLM_MODEL"] = CURRENT_MODEL
+    _ENV_TEMPLATE["LLM_MODEL"] = CURRENT_MODEL
 
+    # On a terminal the child inherits it, keeping colours, line editing and
+    # isatty() behaviour; otherwise its output is relayed in chunks as soon
+    # as it is written
+    relay = not sys.stdout.isatty()
+
+    process = None
     try:
-        subprocess.run([sys.executable, str(script_path)], env=env, check=False)
+        sys.stdout.flush()
+        process = subprocess.Popen(
+            [sys.executable, str(script_path)],
+            env=_ENV_TEMPLATE,
+            stdout=subprocess.PIPE if relay else None,
+            stderr=subprocess.STDOUT if relay else None,
+            bufsize=0,
+        )
+        if relay:
+            out = sys.stdout.buffer
+            while chunk := process.stdout.read(4096):
+                out.write(chunk)
+                out.flush()
+        process.wait()
     except KeyboardInterrupt:
         print(f"\n{RED}❌ Execution interrupted.{RESET}")
+        if process is not None:
+            process.terminate()
+            try:
+                process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                process.kill()
     except Exception as e:
         print(f"\n{RED}❌ Error: {e}{RESET}")
 
-    input(f"\n{GREEN}Press Enter to continue...{RESET}")
+    _prompt(f"\n{GREEN}Press Enter to continue...{RESET}")
 
 
 def pull_model():
@@ -116,11 +235,11 @@ def pull_model():
     print(
         "Enter the model name to pull (e.g., 'mistral', 'llama3', 'lfm2.5-thinking:1.2b')"
     )
-    model_name = input(f"{BOLD}Model Name > {RESET}").strip()
+    model_name = _prompt(f"{BOLD}Model Name > {RESET}").strip()
 
     if not model_name:
         print(f"{RED}No model name entered.{RESET}")
-        input("Press Enter...")
+        _prompt("Press Enter...")
         return
 
     print(f"\n{YELLOW}⬇️  Pulling model {model_name}...{RESET}\n")
@@ -128,11 +247,15 @@ def pull_model():
         subprocess.run(["ollama", "pull", model_name], check=True)
         print(f"\n{GREEN}✅ Model {model_name} pulled successfully!{RESET}")
 
+        # Refresh the model list on the next menu
+        global _ollama_models_cache
+        _ollama_models_cache = None
+
         # Ask if user wants to switch to it
-        switch = input(f"\nSwitch to {model_name}? (Y/n) > ").strip().lower()
+        switch = _prompt(f"\nSwitch to {model_name}? (Y/n) > ").strip().lower()
         if switch != "n":
             global CURRENT_MODEL
-            CURRENT_MODEL = model_name
+            CURRENT_MODEL = sys.intern(model_name)
             print(f"\n{CYAN}ℹ️  Switched to model: {CURRENT_MODEL}{RESET}")
 
     except FileNotFoundError:
@@ -140,7 +263,28 @@ def pull_model():
     except Exception as e:
         print(f"\n{RED}❌ Error: {e}{RESET}")
 
-    input(f"\n{GREEN}Press Enter to continue...{RESET}")
+    _prompt(f"\n{GREEN}Press Enter to continue...{RESET}")
+
+
+def pick(choice, options):
+    """
+    Return the option for a 1-based menu choice.
+
+    Reports an invalid choice and waits for Enter, then returns None.
+    """
+    try:
+        idx = int(choice) - 1
+    except ValueError:
+        print(f"{RED}Invalid input.{RESET}")
+        _prompt("Press Enter...")
+        return None
+
+    if 0 <= idx < len(options):
+        return options[idx]
+
+    print(f"{RED}Invalid selection.{RESET}")
+    _prompt("Press Enter...")
+    return None
 
 
 def select_model():
@@ -151,7 +295,7 @@ def select_model():
     ollama_models = get_ollama_models()
     remote_models = get_remote_models()
 
-    all_models = sorted(list(set(ollama_models + remote_models)))
+    all_models = sorted({*ollama_models, *remote_models})
 
     if not all_models:
         print(
@@ -168,44 +312,46 @@ def select_model():
 
     print(f"  {GREEN}[C]{RESET} Custom...")
 
-    choice = input(f"\n{BOLD}Select > {RESET}").strip().lower()
+    choice = _prompt(f"\n{BOLD}Select > {RESET}").strip().lower()
 
     if choice == "c":
-        custom = input("Enter model name: ").strip()
+        custom = _prompt("Enter model name: ").strip()
         if custom:
-            CURRENT_MODEL = custom
+            CURRENT_MODEL = sys.intern(custom)
     else:
-        try:
-            idx = int(choice) - 1
-            if 0 <= idx < len(all_models):
-                CURRENT_MODEL = all_models[idx]
-            else:
-                print(f"{RED}Invalid selection.{RESET}")
-                input("Press Enter...")
-        except ValueError:
-            print(f"{RED}Invalid input.{RESET}")
-            input("Press Enter...")
+        model = pick(choice, all_models)
+        if model is not None:
+            CURRENT_MODEL = model
 
 
 def main():
-    while True:
-        # Clear screen (windows/linux)
-        os.system("cls" if os.name == "nt" else "clear")
+    if os.name == "nt":
+        os.system("")  # Enable ANSI escape handling in the Windows console
 
-        print_header()
+    # Redraw only after something else wrote to the screen or the menu changed
+    dirty = True
+    drawn = None
 
+    while True:
         examples = get_examples()
 
-        print(f"{BOLD}Examples:{RESET}")
-        for i, ex in enumerate(examples, 1):
-            print(f"  {GREEN}[{i}]{RESET} {ex.name}")
-
-        print(f"\n{BOLD}Tools:{RESET}")
-        print(f"  {BLUE}[S]{RESET} Select/Change Model")
-        print(f"  {BLUE}[M]{RESET} Pull New Model")
-        print(f"  {RED}[Q]{RESET} Quit")
-
-        choice = input(f"\n{BOLD}Select an option > {RESET}").strip().lower()
+        if dirty or drawn != (CURRENT_MODEL, examples):
+            # Clear with an escape sequence instead of spawning cls/clear,
+            # then write the whole screen at once
+            parts = [CLEAR_SCREEN, *header_parts(), _EXAMPLES_TITLE]
+            parts.extend(
+                f"  {GREEN}[{i}]{RESET} {ex.name}\n" for i, ex in enumerate(examples, 1)
+            )
+            parts.append(_TOOLS_MENU)
+            sys.stdout.write("".join(parts))
+            drawn = (CURRENT_MODEL, examples)
+
+        choice = _prompt(f"\n{BOLD}Select an option > {RESET}").strip().lower()
+
+        # An empty line leaves the menu as it is
+        dirty = bool(choice)
+        if not choice:
+            continue
 
         if choice == "q":
             print("Goodbye! 👋")
@@ -217,20 +363,13 @@ def main():
             select_model()
             continue
 
-        try:
-            idx = int(choice) - 1
-            if 0 <= idx < len(examples):
-                run_script(examples[idx])
-            else:
-                print(f"{RED}Invalid selection.{RESET}")
-                input("Press Enter...")
-        except ValueError:
-            print(f"{RED}Invalid input.{RESET}")
-            input("Press Enter...")
+        script = pick(choice, examples)
+        if script is not None:
+            run_script(script)
 
 
 if __name__ == "__main__":
     try:
         main()
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, EOFError):
         print("\nGoodbye! 👋")
@@ -1,6 +1,15 @@
 """AutoGen agents package."""
 
 from multi_agent.autogen_agents.agents import create_autogen_team
-from multi_agent.autogen_agents.team import run_autogen_task
+from multi_agent.autogen_agents.team import (
+    run_autogen_task,
+    run_autogen_stream,
+    run_autogen_stream_bytes,
+)
 
-__all__ = ["create_autogen_team", "run_autogen_task"]
+__all__ = [
+    "create_autogen_team",
+    "run_autogen_task",
+    "run_autogen_stream",
+    "run_autogen_stream_bytes",
+]
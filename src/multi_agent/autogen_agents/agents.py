@@ -9,32 +9,59 @@ Key differences with LangGraph:
 - AutoGen: multi-party conversations with automatic routing
 """
 
-from typing import Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
 
-from autogen_core.models import ModelFamily
-from autogen_agentchat.agents import AssistantAgent
-from autogen_agentchat.conditions import TextMentionTermination, MaxMessageTermination
-from autogen_agentchat.teams import RoundRobinGroupChat
-from autogen_ext.models.openai import OpenAIChatCompletionClient
 from loguru import logger
 
 from multi_agent.shared.config import settings, LLMProvider
+from multi_agent.shared.runtime import LoopLocalCache
+
+# AutoGen pulls in openai, httpx and friends; import it only when a
+# client or team is actually built
+if TYPE_CHECKING:
+    from autogen_agentchat.agents import AssistantAgent
 
 
 def get_autogen_model_client():
     """
-    Create the model client for AutoGen.
+    Get the model client for AutoGen.
 
     AutoGen uses a different interface than LangChain.
     Supports OpenAI-compatible APIs (including Ollama via endpoint).
+    The client is shared per event loop, provider, model and endpoint
+    settings, so its HTTP connection pool stays open across teams and
+    tasks but is never used from a loop that did not open it.
     """
-    if settings.llm_provider == LLMProvider.OLLAMA:
+    provider, model = settings.llm_provider, settings.llm_model
+    key = (
+        provider,
+        model,
+        settings.ollama_host,
+        settings.google_api_key,
+        settings.openai_api_key,
+        settings.openai_base_url,
+    )
+    return _model_clients.get_or_create(key, lambda: _build_model_client(provider, model))
+
+
+# Model clients hold async HTTP pools, so they are cached per event loop
+_model_clients = LoopLocalCache(maxsize=4)
+
+
+def _build_model_client(provider: LLMProvider, model: str):
+    """Create the AutoGen model client for a provider and model."""
+    from autogen_core.models import ModelFamily
+    from autogen_ext.models.openai import OpenAIChatCompletionClient
+
+    if provider == LLMProvider.OLLAMA:
         # Ollama exposes an OpenAI-compatible endpoint
         # Determine capabilities based on model name
-        is_thinking = "thinking" in settings.llm_model
+        is_thinking = "thinking" in model
 
         return OpenAIChatCompletionClient(
-            model=settings.llm_model,
+            model=model,
             base_url=f"{settings.ollama_host}/v1",
             api_key="ollama",  # Ollama doesn't require API key
             model_info={
@@ -44,10 +71,10 @@ def get_autogen_model_client():
                 "family": ModelFamily.UNKNOWN,
             },
         )
-    elif settings.llm_provider == LLMProvider.GEMINI:
+    elif provider == LLMProvider.GEMINI:
         # Use Google's OpenAI-compatible endpoint
         return OpenAIChatCompletionClient(
-            model=settings.llm_model,
+            model=model,
             api_key=settings.google_api_key,
             base_url="https://generativelanguage.googleapis.com/v1beta/openai/",
             model_info={
@@ -57,30 +84,58 @@ def get_autogen_model_client():
                 "family": ModelFamily.UNKNOWN,
             },
         )
-    elif settings.llm_provider == LLMProvider.OPENAI:
+    elif provider == LLMProvider.OPENAI:
         return OpenAIChatCompletionClient(
-            model=settings.llm_model,
+            model=model,
             api_key=settings.openai_api_key,
             base_url=settings.openai_base_url,
         )
     else:
-        raise ValueError(f"Provider {settings.llm_provider} not supported in AutoGen")
+        raise ValueError(f"Provider {provider} not supported in AutoGen")
 
 
-def create_autogen_team() -> tuple[list[AssistantAgent], Any]:
+# Single-call variant: one agent plays all three roles and answers in JSON
+FAST_TEAM_SYSTEM_MESSAGE = """You are a team of three experts working in one response:
+1. Project Planner: analyze the requirements and write a short plan in bullet points
+2. Senior Developer: implement complete, clean, documented, working code following the plan
+3. Senior Code Reviewer: verify correctness and quality of the code and list any issues
+
+Respond with a single JSON object and nothing else:
+{"plan": "<bullet-point plan>", "code": "<complete code>", "review": "<review notes>", "approved": <true if the code is correct, otherwise false>}"""
+
+
+def create_autogen_team(fast: bool = False) -> tuple[list[AssistantAgent], Any]:
     """
     Create a team of AutoGen agents.
 
+    Args:
+        fast: Build a single agent that plans, codes and reviews in one
+            model call instead of the three-agent round robin
+
     Returns:
-        Tuple of (agent list, configured team)
+        Tuple of (agent list, configured team). In fast mode the team is
+        the single agent, which supports the same run/run_stream calls.
 
     The team includes:
     - Planner: plans the approach
     - Coder: implements the code
     - Reviewer: validates the work
     """
+    from autogen_agentchat.agents import AssistantAgent
+    from autogen_agentchat.conditions import TextMentionTermination, MaxMessageTermination
+    from autogen_agentchat.teams import RoundRobinGroupChat
+
     model_client = get_autogen_model_client()
 
+    if fast:
+        agent = AssistantAgent(
+            name="Team",
+            model_client=model_client,
+            system_message=FAST_TEAM_SYSTEM_MESSAGE,
+        )
+        logger.info("AutoGen fast team created: Planner, Coder, Reviewer in one agent")
+        return [agent], agent
+
     # Planner Agent
     planner = AssistantAgent(
         name="Planner",
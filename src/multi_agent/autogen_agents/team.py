@@ -4,19 +4,61 @@ AutoGen team execution.
 Manages task execution with the AutoGen multi-agent team.
 """
 
-from autogen_agentchat.messages import TextMessage
-from autogen_core import CancellationToken
+import io
+import json
+
 from loguru import logger
 
 from multi_agent.autogen_agents.agents import create_autogen_team
 
 
-async def run_autogen_task(task: str) -> str:
+def _parse_fast_result(content: str) -> dict | None:
+    """Extract the JSON object from a fast-team reply, or None if malformed."""
+    start = content.find("{")
+    end = content.rfind("}")
+    if start == -1 or end < start:
+        return None
+    try:
+        data = json.loads(content[start : end + 1])
+    except json.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+async def _run_fast_task(task: str) -> str | None:
+    """
+    Run a task as a single batched Planner/Coder/Reviewer call.
+
+    Returns:
+        Formatted output, or None if the reply was not approved or not valid JSON
+    """
+    from autogen_core import CancellationToken
+
+    agents, agent = create_autogen_team(fast=True)
+    result = await agent.run(task=task, cancellation_token=CancellationToken())
+
+    reply = result.messages[-1].content if result.messages else ""
+    data = _parse_fast_result(reply) if isinstance(reply, str) else None
+    if not data or data.get("approved") is not True:
+        return None
+
+    return "\n\n".join(
+        [
+            f"**Planner**: {data.get('plan', '')}",
+            f"**Coder**: {data.get('code', '')}",
+            f"**Reviewer**: {data.get('review', '')}\n\nAPPROVED",
+        ]
+    )
+
+
+async def run_autogen_task(task: str, fast: bool = False) -> str:
     """
     Execute a task with the AutoGen team.
 
     Args:
         task: Task description to complete
+        fast: Try a single batched model call first, falling back to the
+            full round-robin team if the reviewer does not approve
 
     Returns:
         Final conversation output
@@ -25,8 +67,17 @@ async def run_autogen_task(task: str) -> str:
         >>> result = await run_autogen_task("Create a Python class to manage a todo list")
         >>> print(result)
     """
+    from autogen_core import CancellationToken
+
     logger.info(f"Starting AutoGen task: {task[:50]}...")
 
+    if fast:
+        output = await _run_fast_task(task)
+        if output is not None:
+            logger.info("AutoGen task completed in fast mode")
+            return output
+        logger.info("Fast mode not approved, falling back to the full team")
+
     # Create team
     agents, team = create_autogen_team()
 
@@ -36,16 +87,18 @@ async def run_autogen_task(task: str) -> str:
         cancellation_token=CancellationToken(),
     )
 
-    # Extract output
-    messages = result.messages
-
-    # Format output
-    output_parts = []
-    for msg in messages:
-        if hasattr(msg, "source") and hasattr(msg, "content"):
-            output_parts.append(f"**{msg.source}**: {msg.content}")
+    # Format output straight into one buffer
+    buf = io.StringIO()
+    for msg in result.messages:
+        source = getattr(msg, "source", None)
+        content = getattr(msg, "content", None)
+        if source is None or content is None:
+            continue
+        if buf.tell():
+            buf.write("\n\n")
+        buf.write(f"**{source}**: {content}")
 
-    final_output = "\n\n".join(output_parts)
+    final_output = buf.getvalue()
 
     logger.info("AutoGen task completed")
 
@@ -53,10 +106,26 @@ async def run_autogen_task(task: str) -> str:
 
 
 def run_autogen_task_sync(task: str) -> str:
-    """Synchronous version of run_autogen_task."""
-    import asyncio
+    """Synchronous version of run_autogen_task (reuses one event loop across calls)."""
+    from multi_agent.shared.runtime import run_sync
 
-    return asyncio.run(run_autogen_task(task))
+    return run_sync(run_autogen_task(task))
+
+
+async def _stream_messages(task: str):
+    """Run the team and yield (source, content) for each streamed message."""
+    from autogen_core import CancellationToken
+
+    logger.info(f"Starting AutoGen streaming task: {task[:50]}...")
+
+    agents, team = create_autogen_team()
+
+    async for message in team.run_stream(
+        task=task,
+        cancellation_token=CancellationToken(),
+    ):
+        if hasattr(message, "source") and hasattr(message, "content"):
+            yield message.source, message.content
 
 
 async def run_autogen_stream(task: str):
@@ -70,13 +139,26 @@ async def run_autogen_stream(task: str):
         >>> async for msg in run_autogen_stream("Write a function..."):
         ...     print(msg)
     """
-    logger.info(f"Starting AutoGen streaming task: {task[:50]}...")
+    async for source, content in _stream_messages(task):
+        yield f"**{source}**: {content}"
 
-    agents, team = create_autogen_team()
 
-    async for message in team.run_stream(
-        task=task,
-        cancellation_token=CancellationToken(),
-    ):
-        if hasattr(message, "source") and hasattr(message, "content"):
-            yield f"**{message.source}**: {message.content}"
+async def run_autogen_stream_bytes(task: str):
+    """
+    Execute task with message streaming, yielding UTF-8 encoded messages.
+
+    Preferred over run_autogen_stream when writing to a byte sink such as
+    sys.stdout.buffer or a socket, since each message is encoded once here
+    instead of again by the text layer. Keep run_autogen_stream for
+    notebooks and other str consumers.
+
+    Example:
+        >>> async for chunk in run_autogen_stream_bytes("Write a function..."):
+        ...     sys.stdout.buffer.write(chunk + b"\\n")
+    """
+    async for source, content in _stream_messages(task):
+        if isinstance(content, bytes):
+            body = content
+        else:
+            body = (content if isinstance(content, str) else str(content)).encode("utf-8")
+        yield f"**{source}**: ".encode("utf-8") + body
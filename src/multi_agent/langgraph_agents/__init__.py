@@ -1,6 +1,18 @@
 """LangGraph agents package."""
 
-from multi_agent.langgraph_agents.graph import create_multi_agent_graph, run_task
+from multi_agent.langgraph_agents.graph import (
+    create_multi_agent_graph,
+    get_multi_agent_graph,
+    run_task,
+    run_task_stream,
+)
 from multi_agent.langgraph_agents.nodes import AgentNode, create_agent_node
 
-__all__ = ["create_multi_agent_graph", "run_task", "AgentNode", "create_agent_node"]
+__all__ = [
+    "create_multi_agent_graph",
+    "get_multi_agent_graph",
+    "run_task",
+    "run_task_stream",
+    "AgentNode",
+    "create_agent_node",
+]
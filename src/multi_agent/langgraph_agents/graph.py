@@ -11,42 +11,81 @@ This module implements a team of collaborating agents:
 4. Reviewer validates the work
 """
 
+import asyncio
 import re
+from collections import OrderedDict
+from collections.abc import AsyncIterator
 from typing import Literal
 
-from langchain_core.messages import HumanMessage, AIMessage
-from langgraph.graph import StateGraph, END
+from langchain_core.messages import HumanMessage
 from loguru import logger
 
-from multi_agent.langgraph_agents.nodes import AgentState, create_agent_node
-from multi_agent.shared import create_llm
+from multi_agent.langgraph_agents.nodes import (
+    CACHED_RESPONSE_EVENT,
+    AgentState,
+    create_agent_node,
+)
+from multi_agent.shared import create_llm, message_text
+
+# Routing directive emitted by the orchestrator, e.g. "NEXT_AGENT: coder"
+_NEXT_AGENT_RE = re.compile(r"NEXT_AGENT:\s*(\w+)", re.IGNORECASE)
+_WORKER_AGENTS = frozenset({"researcher", "coder", "reviewer"})
+# Fan-out directive, e.g. "NEXT_AGENT: parallel(researcher, coder)"
+_PARALLEL_RE = re.compile(r"NEXT_AGENT:\s*parallel\(([^)]*)\)", re.IGNORECASE)
+
+# Compiled graphs by id(llm); the LLM is kept alive so its id is not reused
+_GRAPH_CACHE: OrderedDict[int, tuple] = OrderedDict()
+_GRAPH_CACHE_SIZE = 8
+
+
+def _last_content(state: AgentState) -> str:
+    """Text of the last message in the state (empty if there is none)."""
+    messages = state["messages"]
+    if not messages:
+        return ""
+    last_message = messages[-1]
+    return last_message.content if hasattr(last_message, "content") else str(last_message)
+
+
+def _parallel_agents(content: str) -> list[str]:
+    """Worker agents named in a NEXT_AGENT: parallel(...) directive, in order."""
+    match = _PARALLEL_RE.search(content)
+    if not match:
+        return []
+    names = dict.fromkeys(name.strip().lower() for name in match.group(1).split(","))
+    return [name for name in names if name in _WORKER_AGENTS]
 
 
 def should_continue(
     state: AgentState,
-) -> Literal["researcher", "coder", "reviewer", "end"]:
+) -> Literal["researcher", "coder", "reviewer", "parallel", "end"]:
     """
     Router: decide next step based on orchestrator output.
 
     Analyzes the last message to extract NEXT_AGENT.
     """
-    messages = state["messages"]
-    if not messages:
+    if not state["messages"]:
         return "end"
 
-    last_message = messages[-1]
-    content = (
-        last_message.content if hasattr(last_message, "content") else str(last_message)
-    )
+    content = _last_content(state)
+
+    # Independent steps requested together run in the fan-out node
+    parallel = _parallel_agents(content)
+    if len(parallel) > 1:
+        print(f"   [Router] Decision: Run {', '.join(a.upper() for a in parallel)} in parallel")
+        return "parallel"
+    if parallel:
+        print(f"   [Router] Decision: Transfer to {parallel[0].upper()}")
+        return parallel[0]
 
     # Look for pattern NEXT_AGENT: xxx
-    match = re.search(r"NEXT_AGENT:\s*(\w+)", content, re.IGNORECASE)
+    match = _NEXT_AGENT_RE.search(content)
     if match:
         next_agent = match.group(1).lower()
         if next_agent == "finish":
             print(f"   [Router] Decision: FINISH (Task completed)")
             return "end"
-        if next_agent in ["researcher", "coder", "reviewer"]:
+        if next_agent in _WORKER_AGENTS:
             print(f"   [Router] Decision: Transfer to {next_agent.upper()}")
             return next_agent
 
@@ -61,7 +100,7 @@ def create_multi_agent_graph(llm=None):
 
     Structure:
     ```
-    START -> orchestrator -> [researcher|coder|reviewer] -> orchestrator -> ... -> END
+    START -> orchestrator -> [researcher|coder|reviewer|parallel] -> orchestrator -> ... -> END
     ```
 
     Args:
@@ -70,6 +109,9 @@ def create_multi_agent_graph(llm=None):
     Returns:
         CompiledGraph ready to use
     """
+    # Imported here so that importing this module stays cheap
+    from langgraph.graph import StateGraph, END
+
     llm = llm or create_llm()
 
     # Create agents
@@ -77,6 +119,16 @@ def create_multi_agent_graph(llm=None):
     researcher = create_agent_node("researcher", "researcher", llm)
     coder = create_agent_node("coder", "coder", llm)
     reviewer = create_agent_node("reviewer", "reviewer", llm)
+    workers = {"researcher": researcher, "coder": coder, "reviewer": reviewer}
+
+    async def parallel(state: AgentState) -> dict:
+        """Run the workers named by the orchestrator concurrently."""
+        names = _parallel_agents(_last_content(state))
+        results = await asyncio.gather(*(workers[name](state) for name in names))
+        return {
+            "messages": [msg for result in results for msg in result["messages"]],
+            "current_agent": ",".join(names),
+        }
 
     # Build the graph
     workflow = StateGraph(AgentState)
@@ -86,6 +138,7 @@ def create_multi_agent_graph(llm=None):
     workflow.add_node("researcher", researcher)
     workflow.add_node("coder", coder)
     workflow.add_node("reviewer", reviewer)
+    workflow.add_node("parallel", parallel)
 
     # Entry point
     workflow.set_entry_point("orchestrator")
@@ -98,6 +151,7 @@ def create_multi_agent_graph(llm=None):
             "researcher": "researcher",
             "coder": "coder",
             "reviewer": "reviewer",
+            "parallel": "parallel",
             "end": END,
         },
     )
@@ -106,6 +160,7 @@ def create_multi_agent_graph(llm=None):
     workflow.add_edge("researcher", "orchestrator")
     workflow.add_edge("coder", "orchestrator")
     workflow.add_edge("reviewer", "orchestrator")
+    workflow.add_edge("parallel", "orchestrator")
 
     # Compile
     graph = workflow.compile()
@@ -114,6 +169,33 @@ def create_multi_agent_graph(llm=None):
     return graph
 
 
+def get_multi_agent_graph(llm=None):
+    """
+    Get the compiled multi-agent graph for an LLM, building it once.
+
+    The compiled graph holds no per-run state, so one instance can serve
+    any number of (concurrent) tasks.
+
+    Args:
+        llm: LLM to use for all agents (default: from settings)
+
+    Returns:
+        CompiledGraph ready to use
+    """
+    llm = llm or create_llm()
+
+    entry = _GRAPH_CACHE.get(id(llm))
+    if entry is not None and entry[0] is llm:
+        _GRAPH_CACHE.move_to_end(id(llm))
+        return entry[1]
+
+    graph = create_multi_agent_graph(llm)
+    _GRAPH_CACHE[id(llm)] = (llm, graph)
+    if len(_GRAPH_CACHE) > _GRAPH_CACHE_SIZE:
+        _GRAPH_CACHE.popitem(last=False)
+    return graph
+
+
 async def run_task(task: str, llm=None, max_iterations: int = 10) -> str:
     """
     Execute a task with the multi-agent team.
@@ -130,7 +212,7 @@ async def run_task(task: str, llm=None, max_iterations: int = 10) -> str:
         >>> result = await run_task("Write a Python function that calculates factorial")
         >>> print(result)
     """
-    graph = create_multi_agent_graph(llm)
+    graph = get_multi_agent_graph(llm)
 
     # Initial state
     initial_state: AgentState = {
@@ -161,8 +243,56 @@ async def run_task(task: str, llm=None, max_iterations: int = 10) -> str:
     return output
 
 
+async def run_task_stream(
+    task: str, llm=None, max_iterations: int = 10
+) -> AsyncIterator[tuple[str, str]]:
+    """
+    Execute a task with the multi-agent team, streaming model output.
+
+    Tokens are yielded as each agent generates them, so callers can show
+    progress long before the whole workflow has finished.
+
+    Args:
+        task: Task description
+        llm: LLM to use (default: from settings)
+        max_iterations: Max iterations to avoid infinite loops
+
+    Yields:
+        (agent name, text chunk) tuples
+
+    Example:
+        >>> async for agent, text in run_task_stream("Write a factorial function"):
+        ...     print(text, end="", flush=True)
+    """
+    graph = get_multi_agent_graph(llm)
+
+    initial_state: AgentState = {
+        "messages": [HumanMessage(content=task)],
+        "current_agent": "",
+        "task_complete": False,
+        "final_output": "",
+    }
+
+    logger.info(f"Starting streaming task: {task[:50]}...")
+
+    config = {"recursion_limit": max_iterations}
+    async for event in graph.astream_events(initial_state, config, version="v2"):
+        if event["event"] == "on_chat_model_stream":
+            content = message_text(event["data"]["chunk"])
+        elif event["event"] == "on_custom_event" and event["name"] == CACHED_RESPONSE_EVENT:
+            # A node answered from its result cache without calling the model
+            content = event["data"]["content"]
+        else:
+            continue
+
+        if content:
+            yield event["metadata"].get("langgraph_node", ""), content
+
+    logger.info("Task completed")
+
+
 def run_task_sync(task: str, llm=None, max_iterations: int = 10) -> str:
-    """Synchronous version of run_task."""
-    import asyncio
+    """Synchronous version of run_task (reuses one event loop across calls)."""
+    from multi_agent.shared.runtime import run_sync
 
-    return asyncio.run(run_task(task, llm, max_iterations))
+    return run_sync(run_task(task, llm, max_iterations))
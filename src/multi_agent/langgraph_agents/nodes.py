@@ -10,21 +10,44 @@ LangGraph models agents as nodes in a state graph,
 where transitions depend on agent output.
 """
 
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
 from typing import Annotated, TypedDict, Sequence, Literal
+from langchain_core.callbacks import adispatch_custom_event
 from langchain_core.messages import (
     BaseMessage,
     HumanMessage,
     AIMessage,
-    SystemMessage,
     ToolMessage,
 )
 from langchain_core.language_models import BaseChatModel
 from langgraph.graph import add_messages
 from loguru import logger
 
-from multi_agent.shared import create_llm
+from multi_agent.shared import (
+    create_llm,
+    cached_system_message,
+    message_text,
+    enable_prompt_cache,
+    get_llm_provider,
+)
 from multi_agent.tools import ALL_TOOLS
 
+# Results kept per node for replayed inputs
+RESULT_CACHE_MAX = 128
+
+# Custom event carrying a cached answer, since no chat model runs on a hit
+CACHED_RESPONSE_EVENT = "cached_response"
+
+# Turns that used one of these tools are not cached: writes must happen
+# again on a replay, and reads may return different file contents
+_UNCACHEABLE_TOOLS = frozenset({"write_file", "read_file"})
+
+# Message fields that vary between runs without changing the conversation
+_KEY_EXCLUDE = frozenset({"id", "response_metadata", "usage_metadata"})
+
 
 # Shared graph state
 class AgentState(TypedDict):
@@ -56,7 +79,7 @@ class AgentNode:
         ...     system_prompt="You are an expert researcher...",
         ...     tools=[web_search]
         ... )
-        >>> state = researcher(current_state)
+        >>> state = await researcher(current_state)
     """
 
     def __init__(
@@ -64,12 +87,15 @@ class AgentNode:
         name: str,
         system_prompt: str,
         llm: BaseChatModel | None = None,
-        tools: list | None = None,
+        tools: Sequence | None = None,
     ):
         self.name = name
-        self.system_prompt = system_prompt
         self.llm = llm or create_llm()
+        self._provider = get_llm_provider(self.llm)
+        self.system_prompt = system_prompt
         self.tools = tools or []
+        self._tool_by_name = {t.name: t for t in self.tools}
+        self._result_cache: OrderedDict[bytes, tuple[BaseMessage, ...]] = OrderedDict()
 
         # Bind tools to LLM if present
         if self.tools:
@@ -77,73 +103,144 @@ class AgentNode:
         else:
             self.llm_with_tools = self.llm
 
-    def __call__(self, state: AgentState) -> dict:
-        """
-        Execute the agent on current state.
+        self.llm_with_tools = enable_prompt_cache(
+            self.llm_with_tools, f"agent-{name}", self._provider
+        )
+
+    @property
+    def system_prompt(self) -> str:
+        return self._system_prompt
+
+    @system_prompt.setter
+    def system_prompt(self, value: str) -> None:
+        # The system prompt is the same on every turn: build its message once,
+        # marked for provider-side prompt caching where the provider needs that
+        self._system_prompt = value
+        self._system_message = cached_system_message(value, self._provider)
+
+    def _cache_key(self, messages: Sequence[BaseMessage]) -> bytes:
+        """Digest of the prompt, conversation and tools that determine a result."""
+        # Message type, content and tool calls all count, so a human "hi"
+        # and an assistant "hi" are different conversations
+        payload = json.dumps(
+            [
+                self.system_prompt,
+                [m.model_dump(exclude=_KEY_EXCLUDE) for m in messages],
+                list(self._tool_by_name),
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+    async def _run_tool(self, tc: dict) -> ToolMessage:
+        """Execute one tool call and wrap its result (or error) in a ToolMessage."""
+        tool_name = tc["name"]
+        logger.info(f"[{self.name}] Calling tool: {tool_name}")
+
+        # Find the tool
+        tool = self._tool_by_name.get(tool_name)
+        if tool:
+            try:
+                # ainvoke runs sync tools in the default executor
+                result = await tool.ainvoke(tc["args"])
+                content = str(result)
+            except Exception as e:
+                content = f"Error executing tool: {e}"
+        else:
+            content = f"Tool {tool_name} not found."
 
-        Args:
-            state: Current graph state
+        return ToolMessage(content=content, tool_call_id=tc["id"])
+
+    async def _run_turn(self, state: AgentState) -> tuple[list[BaseMessage], bool]:
+        """
+        Run the model and its tool calls until it answers.
 
         Returns:
-            State updates
+            The messages produced in this turn, and whether they may be cached
         """
-        logger.info(f"[{self.name}] Processing...")
+        cacheable = True
 
-        # Prepare messages with system prompt
-        messages = [SystemMessage(content=self.system_prompt)]
-        messages.extend(state["messages"])
+        # The static system message comes first and the list only grows at
+        # the end, so the prompt prefix stays stable for provider KV caches
+        messages = [self._system_message, *state["messages"]]
 
         # Track new messages generated in this step
         new_messages = []
 
         # Invoke LLM
-        response = self.llm_with_tools.invoke(messages)
+        response = await self.llm_with_tools.ainvoke(messages)
         new_messages.append(response)
 
         # Process tool calls if any
         while hasattr(response, "tool_calls") and response.tool_calls:
             # If we have tool calls, we need to execute them
             messages.append(response)  # Add trigger message to context
+            if any(tc["name"] in _UNCACHEABLE_TOOLS for tc in response.tool_calls):
+                cacheable = False
 
-            for tc in response.tool_calls:
-                tool_name = tc["name"]
-                tool_args = tc["args"]
-                logger.info(f"[{self.name}] Calling tool: {tool_name}")
-
-                # Find the tool
-                tool = next((t for t in self.tools if t.name == tool_name), None)
-                if tool:
-                    try:
-                        result = tool.invoke(tool_args)
-                        content = str(result)
-                    except Exception as e:
-                        content = f"Error executing tool: {e}"
-                else:
-                    content = f"Tool {tool_name} not found."
-
-                # Create ToolMessage
-                tm = ToolMessage(content=content, tool_call_id=tc["id"])
-                new_messages.append(tm)
-                messages.append(tm)  # Add to context for next LLM call
+            # Results come back in the order of response.tool_calls
+            tool_messages = await asyncio.gather(
+                *(self._run_tool(tc) for tc in response.tool_calls)
+            )
+            new_messages.extend(tool_messages)
+            messages.extend(tool_messages)  # Add to context for next LLM call
 
             # Invoke LLM again with tool outputs
-            response = self.llm_with_tools.invoke(messages)
+            response = await self.llm_with_tools.ainvoke(messages)
             new_messages.append(response)
 
         # Gemini returns list of dicts for content, normalize to string
-        if isinstance(response.content, list):
-            text_content = "".join(
-                item.get("text", "")
-                for item in response.content
-                if isinstance(item, dict) and item.get("type") == "text"
-            )
+        if type(response.content) is list:
             # Update content in place (safe for AIMessage)
-            response.content = text_content
+            response.content = message_text(response)
 
-        logger.info(f"[{self.name}] Response generated")
-        print(f"   ✓ {self.name.capitalize()} completed step.")
+        return new_messages, cacheable
+
+    async def _emit_cached(self, response: BaseMessage) -> None:
+        """Report a cached answer to event streams, which see no model run on a hit."""
+        try:
+            await adispatch_custom_event(
+                CACHED_RESPONSE_EVENT, {"content": message_text(response)}
+            )
+        except RuntimeError:
+            # Called outside a graph run: there is no stream to report to
+            pass
+
+    async def __call__(self, state: AgentState) -> dict:
+        """
+        Execute the agent on current state.
+
+        Tool calls requested in the same model turn run concurrently, so a
+        turn takes as long as its slowest tool rather than the sum.
+
+        Args:
+            state: Current graph state
+
+        Returns:
+            State updates
+        """
+        logger.info(f"[{self.name}] Processing...")
+
+        # A node given the same conversation again answers from its cache
+        key = self._cache_key(state["messages"])
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+            logger.info(f"[{self.name}] Cache hit")
+            # Fresh ids, so add_messages appends the replayed turn (tool
+            # calls included) instead of replacing the original messages
+            new_messages = [m.model_copy(update={"id": None}) for m in cached]
+            await self._emit_cached(new_messages[-1])
+        else:
+            new_messages, cacheable = await self._run_turn(state)
+            if cacheable:
+                self._result_cache[key] = tuple(m.model_copy() for m in new_messages)
+                if len(self._result_cache) > RESULT_CACHE_MAX:
+                    self._result_cache.popitem(last=False)
 
         logger.info(f"[{self.name}] Response generated")
+        print(f"   ✓ {self.name.capitalize()} completed step.")
 
         return {
             "messages": new_messages,
@@ -151,69 +248,77 @@ class AgentNode:
         }
 
 
-def create_agent_node(
-    name: str,
-    role: Literal["orchestrator", "researcher", "coder", "reviewer"],
-    llm: BaseChatModel | None = None,
-) -> AgentNode:
-    """
-    Factory to create pre-configured agent nodes.
-
-    Args:
-        name: Unique node name
-        role: Agent role
-        llm: LLM to use (default: from settings)
-
-    Returns:
-        Configured AgentNode
-    """
-    prompts = {
-        "orchestrator": """You are the Team Orchestrator. Your role is:
+# System prompt for each role
+_PROMPTS = {
+    "orchestrator": """You are the Team Orchestrator. Your role is:
 1. Analyze the user's task
 2. Decide which agent should work on it (researcher, coder, reviewer)
 3. Coordinate the workflow
 4. Aggregate final results
 
 Always respond in this format:
-NEXT_AGENT: [researcher|coder|reviewer|FINISH]
-INSTRUCTION: [instructions for next agent or final result]""",
-        "researcher": """You are an Expert Researcher. Your role is:
+NEXT_AGENT: [researcher|coder|reviewer|parallel(researcher,coder)|FINISH]
+INSTRUCTION: [instructions for next agent or final result]
+
+Use parallel(...) with two or more agents when their steps are independent,
+e.g. research and scaffolding code; they will work at the same time.""",
+    "researcher": """You are an Expert Researcher. Your role is:
 1. Search for relevant information
 2. Analyze and synthesize data
 3. Provide context and background
 
 You have access to search tools. Always use tools when needed.
 Respond with structured information and cite sources when possible.""",
-        "coder": """You are a Senior Developer. Your role is:
+    "coder": """You are a Senior Developer. Your role is:
 1. Write clean, working code
 2. Implement solutions based on requirements
 3. Follow best practices
 
 Always write complete, testable code.
 Include explanatory comments.""",
-        "reviewer": """You are an Expert Code Reviewer. Your role is:
+    "reviewer": """You are an Expert Code Reviewer. Your role is:
 1. Analyze the produced code
 2. Identify bugs and issues
 3. Suggest improvements
 
 Be constructive and specific in feedback.
 If the code is good, confirm it.""",
-    }
-
-    tools_map = {
-        "orchestrator": [],
-        "researcher": [
-            t for t in ALL_TOOLS if t.name in ["web_search_mock", "read_file"]
-        ],
-        "coder": [
-            t for t in ALL_TOOLS if t.name in ["write_file", "read_file", "calculate"]
-        ],
-        "reviewer": [t for t in ALL_TOOLS if t.name in ["read_file"]],
-    }
+}
+
+# Tools each role may use, by name
+_ROLE_TOOL_NAMES = {
+    "orchestrator": (),
+    "researcher": ("web_search_mock", "read_file"),
+    "coder": ("write_file", "read_file", "calculate"),
+    "reviewer": ("read_file",),
+}
 
+# Resolved once at import; create_agent_node only looks roles up
+_TOOLS_MAP = {
+    role: tuple(t for t in ALL_TOOLS if t.name in names)
+    for role, names in _ROLE_TOOL_NAMES.items()
+}
+
+
+def create_agent_node(
+    name: str,
+    role: Literal["orchestrator", "researcher", "coder", "reviewer"],
+    llm: BaseChatModel | None = None,
+) -> AgentNode:
+    """
+    Factory to create pre-configured agent nodes.
+
+    Args:
+        name: Unique node name
+        role: Agent role
+        llm: LLM to use (default: from settings)
+
+    Returns:
+        Configured AgentNode
+    """
     return AgentNode(
         name=name,
-        system_prompt=prompts[role],
+        system_prompt=_PROMPTS[role],
         llm=llm,
-        tools=tools_map[role],
+        tools=_TOOLS_MAP[role],
     )
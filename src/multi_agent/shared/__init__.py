@@ -1,39 +1,65 @@
 """Shared components package."""
 
+import importlib
+
 from multi_agent.shared.config import settings
-from multi_agent.shared.llm_factory import create_llm, LLMType
+from multi_agent.shared.llm_factory import (
+    create_llm,
+    enable_llm_cache,
+    enable_prompt_cache,
+    cached_system_message,
+    get_text_extractor,
+    get_llm_provider,
+    message_text,
+    LLMType,
+)
 from multi_agent.shared.memory import AgentMemory, SharedMemory
+from multi_agent.shared.console import ainput, input_future
+
+# Optional components (RAG, MCP, A2A) pull in heavy dependencies such as
+# chromadb and aiohttp, so they are imported on first access (PEP 562).
+# A component whose dependencies are missing resolves to None.
+_LAZY_IMPORTS = {
+    "RAGStore": "multi_agent.shared.rag",
+    "RAGAgent": "multi_agent.shared.rag",
+    "MCPServer": "multi_agent.shared.mcp",
+    "MCPClient": "multi_agent.shared.mcp",
+    "MCPTool": "multi_agent.shared.mcp",
+    "AgentCard": "multi_agent.shared.a2a",
+    "A2AServer": "multi_agent.shared.a2a",
+    "A2AClient": "multi_agent.shared.a2a",
+    "AgentNetwork": "multi_agent.shared.a2a",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        value = getattr(importlib.import_module(module_name), name)
+    except ImportError:
+        value = None
+
+    globals()[name] = value
+    return value
 
-# RAG components
-try:
-    from multi_agent.shared.rag import RAGStore, RAGAgent
-except ImportError:
-    RAGStore = None
-    RAGAgent = None
-
-# MCP components
-try:
-    from multi_agent.shared.mcp import MCPServer, MCPClient, MCPTool
-except ImportError:
-    MCPServer = None
-    MCPClient = None
-    MCPTool = None
-
-# A2A components
-try:
-    from multi_agent.shared.a2a import AgentCard, A2AServer, A2AClient, AgentNetwork
-except ImportError:
-    AgentCard = None
-    A2AServer = None
-    A2AClient = None
-    AgentNetwork = None
 
 __all__ = [
     "settings",
     "create_llm",
+    "enable_llm_cache",
+    "enable_prompt_cache",
+    "cached_system_message",
+    "get_text_extractor",
+    "get_llm_provider",
+    "message_text",
     "LLMType",
     "AgentMemory",
     "SharedMemory",
+    "ainput",
+    "input_future",
     "RAGStore",
     "RAGAgent",
     "MCPServer",
@@ -0,0 +1,47 @@
+"""
+JSON helpers shared by the MCP and A2A protocol modules.
+
+orjson is used when installed (pip install multi-agent-system[speedups])
+and the standard library otherwise. Both accept the same inputs: orjson
+runs with OPT_NON_STR_KEYS, so int, float, bool and None keys are written
+as strings just like json.dumps does.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dumps(obj: Any) -> str:
+    """Serialize to a JSON string."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=_ORJSON_OPTS).decode()
+    return json.dumps(obj)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, ready for a response body."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=_ORJSON_OPTS)
+    return json.dumps(obj).encode()
+
+
+def dumps_line(obj: Any) -> bytes:
+    """Serialize as one newline-terminated UTF-8 line."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=_ORJSON_OPTS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj) + "\n").encode()
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON from a string or UTF-8 bytes."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -11,16 +11,126 @@ different machines or processes. This module provides:
 Learn more: https://google.github.io/A2A/
 """
 
-import json
 import asyncio
-from dataclasses import dataclass, field, asdict
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, defaultdict, deque
+from dataclasses import dataclass, field
 from typing import Any, Callable, Awaitable
 from enum import Enum
 from datetime import datetime
 import uuid
+import weakref
 
 from loguru import logger
 
+from multi_agent.shared._json import (
+    dumps as _json_dumps,
+    dumps_bytes as _json_dumps_bytes,
+    loads as _json_loads,
+)
+from multi_agent.shared.runtime import new_event_loop
+
+# Worker threads for task handlers run on their own event loops
+_agent_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="a2a-sub")
+
+# Default bounds for a server's task and message history
+MAX_TASKS = 10_000
+TASK_TTL = 3600.0  # seconds
+MAX_MESSAGES = 10_000
+
+# Longest a GET /tasks/{id}/wait request is held open; kept below the
+# client request timeout so a long-poll never times out client-side
+LONG_POLL_TIMEOUT = 20.0  # seconds
+
+# Polling fallback for servers without the long-poll endpoint
+POLL_BACKOFF_START = 0.25  # seconds, doubled up to poll_interval
+
+# Connection pool shared by all A2AClient sessions on an event loop
+CONNECTOR_LIMIT = 200
+CONNECTOR_LIMIT_PER_HOST = 32
+CONNECTOR_KEEPALIVE = 60.0  # seconds
+REQUEST_TIMEOUT = 30.0  # seconds
+
+# Agent cards fetched at once by AgentNetwork.register_many
+REGISTER_CONCURRENCY = 32
+
+# aiohttp connectors belong to the loop they were created on, so there is
+# one per loop (isolated task handlers run their own loops)
+_connectors: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _shared_connector():
+    """Get the keep-alive connector for the running loop, creating it once."""
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    connector = _connectors.get(loop)
+    if connector is None or connector.closed:
+        connector = aiohttp.TCPConnector(
+            limit=CONNECTOR_LIMIT,
+            limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+            keepalive_timeout=CONNECTOR_KEEPALIVE,
+            enable_cleanup_closed=True,
+        )
+        _connectors[loop] = connector
+    return connector
+
+
+async def close_shared_connector() -> None:
+    """Close the running loop's shared connector and its pooled connections."""
+    connector = _connectors.pop(asyncio.get_running_loop(), None)
+    if connector is not None:
+        await connector.close()
+
+
+# Last formatted timestamp as (epoch milliseconds, ISO string); rebound
+# as a whole so threads never see a mismatched pair
+_last_iso: tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """
+    Current local time in ISO format, to millisecond precision.
+
+    Objects created within the same millisecond share one formatted string.
+    """
+    global _last_iso
+    now = time.time()
+    ms = int(now * 1000)
+    last_ms, text = _last_iso
+    if ms != last_ms:
+        text = datetime.fromtimestamp(now).isoformat(timespec="milliseconds")
+        _last_iso = (ms, text)
+    return text
+
+
+def _task_not_found(task_id: str) -> str:
+    """Error text for an unknown task, shared by server and client."""
+    return f"Task not found: {task_id}"
+
+
+async def _is_missing_task(resp, task_id: str) -> bool:
+    """Whether a 404 response reports an unknown task, not an unknown route."""
+    try:
+        body = await resp.json(loads=_json_loads, content_type=None)
+    except ValueError:
+        return False
+    return isinstance(body, dict) and body.get("error") == _task_not_found(task_id)
+
+
+def _run_in_new_loop(coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+    """Run a coroutine to completion on a fresh event loop in this thread."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro_factory())
+    finally:
+        # Release the pooled connections any A2AClient opened on this loop
+        loop.run_until_complete(close_shared_connector())
+        loop.close()
+
 
 class TaskState(str, Enum):
     """Task execution states."""
@@ -32,7 +142,7 @@ class TaskState(str, Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentCard:
     """
     Agent Card - describes an agent's identity and capabilities.
@@ -51,7 +161,15 @@ class AgentCard:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            "name": self.name,
+            "description": self.description,
+            "url": self.url,
+            "version": self.version,
+            "skills": list(self.skills),
+            "input_modes": list(self.input_modes),
+            "output_modes": list(self.output_modes),
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "AgentCard":
@@ -59,7 +177,7 @@ class AgentCard:
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class A2AMessage:
     """
     Message exchanged between agents.
@@ -71,17 +189,25 @@ class A2AMessage:
     content: str = ""
     content_type: str = "text"
     metadata: dict[str, Any] = field(default_factory=dict)
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str = field(default_factory=_now_iso)
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {
+            "id": self.id,
+            "sender": self.sender,
+            "receiver": self.receiver,
+            "content": self.content,
+            "content_type": self.content_type,
+            "metadata": dict(self.metadata),
+            "timestamp": self.timestamp,
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "A2AMessage":
         return cls(**data)
 
 
-@dataclass
+@dataclass(slots=True)
 class A2ATask:
     """
     Task submitted to an agent.
@@ -92,14 +218,21 @@ class A2ATask:
     state: TaskState = TaskState.PENDING
     result: str = ""
     error: str = ""
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = field(default_factory=_now_iso)
     completed_at: str = ""
     metadata: dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        d = asdict(self)
-        d["state"] = self.state.value
-        return d
+        return {
+            "id": self.id,
+            "description": self.description,
+            "state": self.state.value,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "completed_at": self.completed_at,
+            "metadata": dict(self.metadata),
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "A2ATask":
@@ -115,6 +248,7 @@ class A2AServer:
     - GET /.well-known/agent.json - Agent Card
     - POST /tasks - Submit a task
     - GET /tasks/{id} - Get task status
+    - GET /tasks/{id}/wait - Long-poll until the task finishes
     - POST /messages - Send a message
 
     Example:
@@ -131,12 +265,36 @@ class A2AServer:
         ...     return f"Completed: {task.description}"
         >>>
         >>> server.run(port=8001)
+
+    With isolate_tasks=True each task handler runs on its own event loop
+    in a worker thread, so handlers that nest blocking agent calls
+    cannot stall the server loop.
+
+    History is bounded for long-running servers: finished tasks are
+    forgotten task_ttl seconds after they finish, or once more than
+    max_tasks exist (oldest finished first), and only the last
+    max_messages messages are kept. Pending and running tasks are never
+    evicted, so they may briefly push the count above max_tasks.
     """
 
-    def __init__(self, agent_card: AgentCard):
+    def __init__(
+        self,
+        agent_card: AgentCard,
+        isolate_tasks: bool = False,
+        max_tasks: int = MAX_TASKS,
+        task_ttl: float = TASK_TTL,
+        max_messages: int = MAX_MESSAGES,
+    ):
         self.agent_card = agent_card
+        self.isolate_tasks = isolate_tasks
+        self.max_tasks = max_tasks
+        self.task_ttl = task_ttl
         self.tasks: dict[str, A2ATask] = {}
-        self.messages: list[A2AMessage] = []
+        # Expiry deadline of each finished task, in completion order
+        self._finished: OrderedDict[str, float] = OrderedDict()
+        # Set when a task finishes; only unfinished tasks have an entry
+        self._task_done: dict[str, asyncio.Event] = {}
+        self.messages: deque[A2AMessage] = deque(maxlen=max_messages)
         self._task_handler: Callable[[A2ATask], Awaitable[str]] | None = None
         self._message_handler: Callable[[A2AMessage], Awaitable[str]] | None = None
 
@@ -166,6 +324,10 @@ class A2AServer:
             elif method == "POST" and path == "/tasks":
                 return await self._handle_create_task(body or {})
 
+            elif method == "GET" and path.startswith("/tasks/") and path.endswith("/wait"):
+                task_id = path.split("/")[-2]
+                return await self._handle_wait_task(task_id)
+
             elif method == "GET" and path.startswith("/tasks/"):
                 task_id = path.split("/")[-1]
                 return self._handle_get_task(task_id)
@@ -186,7 +348,9 @@ class A2AServer:
             description=body.get("description", ""),
             metadata=body.get("metadata", {}),
         )
+        self._prune_tasks(room=1)
         self.tasks[task.id] = task
+        self._task_done[task.id] = asyncio.Event()
 
         # Process task asynchronously
         asyncio.create_task(self._process_task(task))
@@ -199,7 +363,13 @@ class A2AServer:
 
         try:
             if self._task_handler:
-                result = await self._task_handler(task)
+                if self.isolate_tasks:
+                    handler = self._task_handler
+                    result = await asyncio.get_running_loop().run_in_executor(
+                        _agent_pool, _run_in_new_loop, lambda: handler(task)
+                    )
+                else:
+                    result = await self._task_handler(task)
                 task.result = result
                 task.state = TaskState.COMPLETED
             else:
@@ -210,14 +380,51 @@ class A2AServer:
             task.state = TaskState.FAILED
             logger.exception(f"Task {task.id} failed: {e}")
         finally:
-            task.completed_at = datetime.now().isoformat()
+            task.completed_at = _now_iso()
+            if task.id in self.tasks:
+                self._finished[task.id] = time.monotonic() + self.task_ttl
+            done = self._task_done.pop(task.id, None)
+            if done is not None:
+                done.set()
+
+    def _prune_tasks(self, room: int = 0) -> None:
+        """
+        Drop expired finished tasks.
+
+        With room > 0 (a task is being created) also drop the oldest
+        finished tasks until `room` more fit under max_tasks.
+        """
+        now = time.monotonic()
+        while self._finished:
+            oldest, deadline = next(iter(self._finished.items()))
+            fits = not room or len(self.tasks) + room <= self.max_tasks
+            if fits and deadline > now:
+                break
+            del self._finished[oldest]
+            del self.tasks[oldest]
 
     def _handle_get_task(self, task_id: str) -> tuple[int, dict]:
         """Handle task status query."""
+        self._prune_tasks()
         if task_id not in self.tasks:
-            return 404, {"error": f"Task not found: {task_id}"}
+            return 404, {"error": _task_not_found(task_id)}
         return 200, self.tasks[task_id].to_dict()
 
+    async def _handle_wait_task(self, task_id: str) -> tuple[int, dict]:
+        """
+        Handle a long-poll for task completion.
+
+        Answers as soon as the task finishes, or with its current state
+        after LONG_POLL_TIMEOUT so the client can ask again.
+        """
+        done = self._task_done.get(task_id)
+        if done is not None:
+            try:
+                await asyncio.wait_for(done.wait(), LONG_POLL_TIMEOUT)
+            except TimeoutError:
+                pass
+        return self._handle_get_task(task_id)
+
     async def _handle_message(self, body: dict) -> tuple[int, dict]:
         """Handle incoming message."""
         message = A2AMessage.from_dict(body)
@@ -234,7 +441,8 @@ class A2AServer:
         """
         Run the A2A server.
 
-        Uses aiohttp for async HTTP server.
+        Uses aiohttp for async HTTP server, on uvloop's event loop when it
+        is installed (pip install multi-agent-system[speedups]).
         """
         try:
             from aiohttp import web
@@ -247,16 +455,20 @@ class A2AServer:
             path = request.path
             body = None
             if method in ("POST", "PUT"):
-                body = await request.json()
+                body = _json_loads(await request.read())
 
             status, response = await self.handle_request(method, path, body)
-            return web.json_response(response, status=status)
+            return web.Response(
+                body=_json_dumps_bytes(response),
+                status=status,
+                content_type="application/json",
+            )
 
         app = web.Application()
         app.router.add_route("*", "/{path:.*}", handle)
 
         logger.info(f"Starting A2A server '{self.agent_card.name}' on {host}:{port}")
-        web.run_app(app, host=host, port=port)
+        web.run_app(app, host=host, port=port, loop=new_event_loop())
 
 
 class A2AClient:
@@ -287,18 +499,33 @@ class A2AClient:
         self._session = None
 
     async def _get_session(self):
-        """Get or create aiohttp session."""
+        """
+        Get or create aiohttp session.
+
+        Sessions of all clients on a loop share one pooled connector, so
+        repeated calls to the same agent reuse keep-alive connections.
+        """
         if self._session is None:
             try:
                 import aiohttp
-
-                self._session = aiohttp.ClientSession()
             except ImportError:
                 raise ImportError("aiohttp required. Install with: pip install aiohttp")
+
+            self._session = aiohttp.ClientSession(
+                connector=_shared_connector(),
+                connector_owner=False,
+                json_serialize=_json_dumps,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+            )
         return self._session
 
     async def close(self):
-        """Close the client session."""
+        """
+        Close the client session.
+
+        The shared connector stays open for other clients; use
+        close_shared_connector() at shutdown to release it.
+        """
         if self._session:
             await self._session.close()
             self._session = None
@@ -315,7 +542,7 @@ class A2AClient:
         """
         session = await self._get_session()
         async with session.get(f"{agent_url}/.well-known/agent.json") as resp:
-            data = await resp.json()
+            data = await resp.json(loads=_json_loads)
             return AgentCard.from_dict(data)
 
     async def submit_task(
@@ -339,13 +566,13 @@ class A2AClient:
         payload = {"description": description, "metadata": metadata or {}}
 
         async with session.post(f"{agent_url}/tasks", json=payload) as resp:
-            return await resp.json()
+            return await resp.json(loads=_json_loads)
 
     async def get_task_status(self, agent_url: str, task_id: str) -> dict[str, Any]:
         """Get task status."""
         session = await self._get_session()
         async with session.get(f"{agent_url}/tasks/{task_id}") as resp:
-            return await resp.json()
+            return await resp.json(loads=_json_loads)
 
     async def wait_for_task(
         self,
@@ -357,30 +584,64 @@ class A2AClient:
         """
         Wait for a task to complete.
 
+        Long-polls GET /tasks/{id}/wait, so the result arrives as soon as
+        the task finishes without repeated requests. Servers without that
+        endpoint (404) are polled instead, with the pause between checks
+        doubling from POLL_BACKOFF_START up to poll_interval.
+
         Args:
             agent_url: Base URL of the agent
             task_id: Task ID to wait for
             timeout: Maximum wait time in seconds
-            poll_interval: How often to check status
+            poll_interval: Longest pause between status checks when polling
 
         Returns:
             Final task state
-        """
-        import time
 
-        start = time.time()
-
-        while time.time() - start < timeout:
-            status = await self.get_task_status(agent_url, task_id)
-            state = status.get("state")
+        Raises:
+            ValueError: The server does not know the task (or evicted it)
+            TimeoutError: The task did not finish within timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        long_poll = True
+        delay = min(POLL_BACKOFF_START, poll_interval)
+
+        while (remaining := deadline - loop.time()) > 0:
+            if long_poll:
+                try:
+                    status = await asyncio.wait_for(
+                        self._wait_task_status(agent_url, task_id), remaining
+                    )
+                except TimeoutError:
+                    break
+                if status is None:
+                    long_poll = False
+                    continue
+            else:
+                status = await self.get_task_status(agent_url, task_id)
+                if status.get("error") == _task_not_found(task_id):
+                    raise ValueError(status["error"])
 
-            if state in (TaskState.COMPLETED.value, TaskState.FAILED.value):
+            if status.get("state") in (TaskState.COMPLETED.value, TaskState.FAILED.value):
                 return status
 
-            await asyncio.sleep(poll_interval)
+            if not long_poll:
+                await asyncio.sleep(min(delay, remaining))
+                delay = min(delay * 2, poll_interval)
 
         raise TimeoutError(f"Task {task_id} did not complete within {timeout}s")
 
+    async def _wait_task_status(self, agent_url: str, task_id: str) -> dict[str, Any] | None:
+        """One long-poll request; None if the server does not support it."""
+        session = await self._get_session()
+        async with session.get(f"{agent_url}/tasks/{task_id}/wait") as resp:
+            if resp.status == 404:
+                if await _is_missing_task(resp, task_id):
+                    raise ValueError(_task_not_found(task_id))
+                return None
+            return await resp.json(loads=_json_loads)
+
     async def send_message(
         self,
         agent_url: str,
@@ -410,7 +671,7 @@ class A2AClient:
         async with session.post(
             f"{agent_url}/messages", json=message.to_dict()
         ) as resp:
-            return await resp.json()
+            return await resp.json(loads=_json_loads)
 
 
 class AgentNetwork:
@@ -424,6 +685,9 @@ class AgentNetwork:
         >>> network.register("http://localhost:8001")
         >>> network.register("http://localhost:8002")
         >>>
+        >>> # Or discover several agents concurrently
+        >>> await network.register_many(["http://localhost:8003", "http://localhost:8004"])
+        >>>
         >>> # Find agent with skill
         >>> agent = await network.find_agent_with_skill("python")
         >>>
@@ -433,8 +697,21 @@ class AgentNetwork:
 
     def __init__(self):
         self.agents: dict[str, AgentCard] = {}
+        # Lowercased skill -> agents offering it, in registration order
+        self._skill_index: defaultdict[str, list[AgentCard]] = defaultdict(list)
         self.client = A2AClient()
 
+    def _add_card(self, card: AgentCard, agent_url: str) -> None:
+        """Store a discovered card and index its skills."""
+        old = self.agents.get(card.name)
+        if old is not None:
+            for skill in {s.lower() for s in old.skills}:
+                self._skill_index[skill].remove(old)
+        self.agents[card.name] = card
+        for skill in {s.lower() for s in card.skills}:
+            self._skill_index[skill].append(card)
+        logger.info(f"Registered agent: {card.name} ({agent_url})")
+
     async def register(self, agent_url: str) -> AgentCard:
         """
         Register an agent by discovering its card.
@@ -446,16 +723,50 @@ class AgentNetwork:
             Discovered AgentCard
         """
         card = await self.client.get_agent_card(agent_url)
-        self.agents[card.name] = card
-        logger.info(f"Registered agent: {card.name} ({agent_url})")
+        self._add_card(card, agent_url)
         return card
 
+    async def register_many(
+        self, agent_urls: list[str], max_concurrency: int = REGISTER_CONCURRENCY
+    ) -> list[AgentCard]:
+        """
+        Register several agents, fetching their cards concurrently.
+
+        All requests share the client's session, so discovery takes about
+        one round trip instead of one per agent. At most max_concurrency
+        cards are fetched at once. An agent that cannot be reached is
+        logged and skipped; the others are still registered.
+
+        Args:
+            agent_urls: Base URLs of the agents
+            max_concurrency: Maximum number of cards fetched at once
+
+        Returns:
+            Discovered AgentCards, in the order of agent_urls
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(url: str) -> AgentCard:
+            async with semaphore:
+                return await self.client.get_agent_card(url)
+
+        results = await asyncio.gather(
+            *(fetch(url) for url in agent_urls), return_exceptions=True
+        )
+
+        cards = []
+        for url, result in zip(agent_urls, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to register agent at {url}: {result}")
+                continue
+            self._add_card(result, url)
+            cards.append(result)
+        return cards
+
     def find_agent_with_skill(self, skill: str) -> AgentCard | None:
-        """Find an agent that has a specific skill."""
-        for card in self.agents.values():
-            if skill.lower() in [s.lower() for s in card.skills]:
-                return card
-        return None
+        """Find an agent that has a specific skill (case-insensitive)."""
+        cards = self._skill_index.get(skill.lower())
+        return cards[0] if cards else None
 
     async def submit_task_to(
         self,
@@ -505,12 +816,19 @@ class AgentNetwork:
         return await self.submit_task_to(card.name, description, wait)
 
     async def broadcast_message(self, content: str, sender: str = "network"):
-        """Send a message to all registered agents."""
-        for card in self.agents.values():
-            try:
-                await self.client.send_message(card.url, content, sender)
-            except Exception as e:
-                logger.error(f"Failed to send to {card.name}: {e}")
+        """
+        Send a message to all registered agents concurrently.
+
+        A failing agent is logged and does not affect the others.
+        """
+        cards = list(self.agents.values())
+        results = await asyncio.gather(
+            *(self.client.send_message(card.url, content, sender) for card in cards),
+            return_exceptions=True,
+        )
+        for card, result in zip(cards, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to send to {card.name}: {result}")
 
     async def close(self):
         """Close network connections."""
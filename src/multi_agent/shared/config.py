@@ -68,6 +68,15 @@ class Settings(BaseSettings):
         default=20, description="Max messages in conversational memory"
     )
 
+    # Cache settings
+    llm_cache: str = Field(
+        default="memory",
+        description="LLM response cache: none, memory, or sqlite",
+    )
+    llm_cache_path: str = Field(
+        default=".langchain_cache.db", description="SQLite file for the sqlite cache"
+    )
+
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
 
@@ -0,0 +1,50 @@
+"""
+Console helpers for interactive examples.
+
+Reading stdin with input() blocks the thread that calls it. These helpers
+run it off the event loop, so streaming and other tasks keep running while
+the user types.
+"""
+
+import asyncio
+import threading
+
+
+def input_future(prompt: str = "") -> asyncio.Future:
+    """
+    Start reading a line from stdin and return a future for it.
+
+    The prompt is shown right away, so the caller can finish other work
+    while the user types. Must be called from a running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def deliver(result: str | None, error: BaseException | None) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def read() -> None:
+        try:
+            line = input(prompt)
+        except BaseException as e:
+            loop.call_soon_threadsafe(deliver, None, e)
+        else:
+            loop.call_soon_threadsafe(deliver, line, None)
+
+    threading.Thread(target=read, daemon=True).start()
+    return future
+
+
+async def ainput(prompt: str = "") -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+
+    input() runs on a daemon thread, so Ctrl+C can still end the program
+    while the prompt is waiting.
+    """
+    return await input_future(prompt)
@@ -5,13 +5,21 @@ Supports transparent switching between local (Ollama) and remote (OpenAI, Anthro
 This is the fundamental pattern for abstracting providers.
 """
 
+from collections.abc import Callable
 from enum import Enum
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any
+from urllib.parse import urlsplit
 
+import httpx
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import SystemMessage
+from langchain_core.runnables import Runnable
 from loguru import logger
 
 from multi_agent.shared.config import settings, LLMProvider
+from multi_agent.shared.runtime import LoopLocalCache
 
 
 class LLMType(str, Enum):
@@ -44,6 +52,38 @@ RECOMMENDED_MODELS = {
 }
 
 
+# Keep-alive pool shared by the HTTP clients of remote providers, so
+# successive requests reuse open TCP/TLS connections
+HTTP_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0
+)
+HTTP_RETRIES = 2
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.Client:
+    """Return the process-wide pooled HTTP client for synchronous calls."""
+    return httpx.Client(
+        transport=httpx.HTTPTransport(retries=HTTP_RETRIES),
+        limits=HTTP_LIMITS,
+        timeout=httpx.Timeout(120.0, connect=10.0),
+    )
+
+
+def _create_http_async_client() -> httpx.AsyncClient:
+    """
+    Create a pooled HTTP client for async calls.
+
+    Async connections belong to the event loop that opened them, so this
+    client is created per LLM instead of being shared process-wide.
+    """
+    return httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(retries=HTTP_RETRIES),
+        limits=HTTP_LIMITS,
+        timeout=httpx.Timeout(120.0, connect=10.0),
+    )
+
+
 def create_llm(
     provider: LLMProvider | None = None,
     model: str | None = None,
@@ -60,7 +100,12 @@ def create_llm(
         **kwargs: Additional parameters for the provider
 
     Returns:
-        BaseChatModel instance ready to use
+        BaseChatModel instance ready to use. Calls on the same event loop
+        with the same provider, model, parameters and settings return the
+        same shared instance, so its HTTP connections are reused without
+        crossing loops. Calls that pass a client object (client,
+        async_client, http_client, http_async_client) or an unhashable
+        parameter (e.g. client_kwargs={...}) always get a new instance.
 
     Example:
         >>> llm = create_llm()  # Uses settings
@@ -74,6 +119,43 @@ def create_llm(
         # Use model from settings or recommended for the type
         model = settings.llm_model or RECOMMENDED_MODELS.get(provider, {}).get(llm_type)
 
+    # An explicit client belongs to the caller, so it must not be handed
+    # to other callers through the cache
+    if not _UNCACHED_KWARGS.isdisjoint(kwargs):
+        return _build_llm(provider, model, **kwargs)
+    try:
+        kwargs_key = frozenset(kwargs.items())
+        hash(kwargs_key)
+    except TypeError:
+        # Unhashable parameters (dicts, lists): build a fresh instance
+        return _build_llm(provider, model, **kwargs)
+
+    key = (provider, model, kwargs_key, _settings_key())
+    return _llm_cache.get_or_create(key, lambda: _build_llm(provider, model, **kwargs))
+
+
+# Shared LLM instances; each holds an async HTTP client, so one per loop
+_llm_cache = LoopLocalCache(maxsize=8)
+
+# Parameters carrying a caller-owned client object; never cached
+_UNCACHED_KWARGS = frozenset({"client", "async_client", "http_client", "http_async_client"})
+
+
+def _settings_key() -> tuple:
+    """Settings that shape a built LLM, so a config change gets a new one."""
+    return (
+        settings.google_api_key,
+        settings.ollama_host,
+        settings.openai_api_key,
+        settings.openai_base_url,
+        settings.anthropic_api_key,
+        settings.agent_temperature,
+        settings.agent_max_tokens,
+    )
+
+
+def _build_llm(provider: LLMProvider, model: str | None, **kwargs: Any) -> BaseChatModel:
+    """Create a new LLM instance for a resolved provider and model."""
     logger.info(f"Creating LLM: provider={provider.value}, model={model}")
 
     # Common parameters
@@ -114,6 +196,8 @@ def _create_ollama_llm(model: str, params: dict, **kwargs) -> BaseChatModel:
     """Create Ollama LLM (local)."""
     from langchain_ollama import ChatOllama
 
+    kwargs.setdefault("client_kwargs", {"limits": HTTP_LIMITS})
+
     return ChatOllama(
         model=model,
         base_url=settings.ollama_host,
@@ -130,6 +214,9 @@ def _create_openai_llm(model: str, params: dict, **kwargs) -> BaseChatModel:
     if not settings.openai_api_key:
         raise ValueError("OPENAI_API_KEY not configured in .env")
 
+    kwargs.setdefault("http_client", get_http_client())
+    kwargs.setdefault("http_async_client", _create_http_async_client())
+
     return ChatOpenAI(
         model=model,
         api_key=settings.openai_api_key,
@@ -156,6 +243,177 @@ def _create_anthropic_llm(model: str, params: dict, **kwargs) -> BaseChatModel:
     )
 
 
+def enable_llm_cache(backend: str | None = None) -> None:
+    """
+    Install a process-wide LangChain response cache.
+
+    Identical prompts sent to the same model are answered from the cache
+    instead of paying a full provider round-trip.
+
+    Args:
+        backend: "none", "memory" or "sqlite" (default: from settings).
+            "sqlite" persists across runs and needs langchain-community;
+            it falls back to "memory" when that package is missing.
+    """
+    from langchain_core.globals import set_llm_cache
+
+    backend = (backend or settings.llm_cache).lower()
+
+    if backend == "none":
+        set_llm_cache(None)
+        return
+
+    if backend == "sqlite":
+        try:
+            from langchain_community.cache import SQLiteCache
+
+            set_llm_cache(SQLiteCache(database_path=settings.llm_cache_path))
+            logger.info(f"LLM cache enabled: sqlite ({settings.llm_cache_path})")
+            return
+        except ImportError:
+            logger.warning("langchain-community not installed, using in-memory LLM cache")
+
+    from langchain_core.caches import InMemoryCache
+
+    set_llm_cache(InMemoryCache())
+    logger.info("LLM cache enabled: memory")
+
+
+_TEXT_GETTER = itemgetter("text")
+
+
+def _join_text_blocks(content: list) -> str:
+    """Join the text blocks of list content (Gemini/Anthropic format)."""
+    # Format: [{'type': 'text', 'text': '...', 'index': 0}]
+    # Blocks are plain dicts, so the exact type check is enough
+    return "".join(
+        _TEXT_GETTER(item)
+        for item in content
+        if type(item) is dict and item.get("type") == "text"
+    )
+
+
+def message_text(message: Any) -> str:
+    """
+    Extract plain text from a message or stream chunk of any provider.
+
+    Content can be a string or a list of content blocks (Gemini, Anthropic);
+    objects without content are converted with str().
+    """
+    content = getattr(message, "content", None)
+    if content is None:
+        return str(message)
+    if type(content) is str:
+        return content
+    return _join_text_blocks(content)
+
+
+def _plain_text(message: Any) -> str:
+    """Extractor for providers whose content is always a string."""
+    return message.content
+
+
+# Text extractors by chat model class; models not listed use message_text
+_TEXT_EXTRACTORS: dict[str, Callable[[Any], str]] = {
+    "ChatOllama": _plain_text,
+}
+
+
+def get_text_extractor(llm: Runnable) -> Callable[[Any], str]:
+    """
+    Return the fastest text extractor for messages produced by `llm`.
+
+    Choose it once before a streaming loop, so each chunk costs a single
+    call instead of repeated format checks.
+
+    Example:
+        >>> extract = get_text_extractor(llm)
+        >>> for chunk in llm.stream(messages):
+        ...     print(extract(chunk), end="")
+    """
+    # Unwrap bound models (bind_tools, bind, ...) to the chat model class
+    while hasattr(llm, "bound"):
+        llm = llm.bound
+    return _TEXT_EXTRACTORS.get(type(llm).__name__, message_text)
+
+
+# Provider behind each chat model class created by this factory
+_PROVIDERS_BY_CLASS: dict[str, LLMProvider] = {
+    "ChatGoogleGenerativeAI": LLMProvider.GEMINI,
+    "ChatOllama": LLMProvider.OLLAMA,
+    "ChatOpenAI": LLMProvider.OPENAI,
+    "ChatAnthropic": LLMProvider.ANTHROPIC,
+}
+
+
+def get_llm_provider(llm: Runnable) -> LLMProvider:
+    """
+    Return the provider behind `llm`, for provider-specific prompt caching.
+
+    Models of unknown classes are assumed to come from the configured
+    provider.
+    """
+    while hasattr(llm, "bound"):
+        llm = llm.bound
+    return _PROVIDERS_BY_CLASS.get(type(llm).__name__, settings.llm_provider)
+
+
+def cached_system_message(
+    content: str, provider: LLMProvider | None = None
+) -> SystemMessage:
+    """
+    Build a system message that the provider can cache between turns.
+
+    Anthropic only caches prompt prefixes marked with cache_control, so the
+    system prompt is sent as a content block carrying that marker. Other
+    providers cache automatically (or not at all) and get a plain message.
+
+    Args:
+        content: System prompt text
+        provider: Provider the message is sent to (default: from settings)
+    """
+    provider = provider or settings.llm_provider
+
+    if provider == LLMProvider.ANTHROPIC:
+        return SystemMessage(
+            content=[
+                {"type": "text", "text": content, "cache_control": {"type": "ephemeral"}}
+            ]
+        )
+    return SystemMessage(content=content)
+
+
+def enable_prompt_cache(
+    llm: Runnable, cache_key: str, provider: LLMProvider | None = None
+) -> Runnable:
+    """
+    Route requests sharing a prompt prefix to the same provider cache.
+
+    OpenAI uses prompt_cache_key to keep conversations with the same prefix
+    on a warm cache, so a growing chat history is not prefilled from scratch
+    every turn. The key is only sent to the official API: compatible servers
+    behind OPENAI_BASE_URL may reject the unknown field. For other providers
+    the LLM is returned unchanged.
+
+    Args:
+        llm: Chat model (or a model with tools already bound)
+        cache_key: Stable key for the conversation or application
+        provider: Provider behind the LLM (default: from settings)
+    """
+    provider = provider or settings.llm_provider
+
+    if provider == LLMProvider.OPENAI and _is_official_openai(settings.openai_base_url):
+        return llm.bind(extra_body={"prompt_cache_key": cache_key})
+    return llm
+
+
+def _is_official_openai(base_url: str | None) -> bool:
+    """Whether base_url points at api.openai.com (the default when unset)."""
+    if not base_url:
+        return True
+    return urlsplit(base_url).hostname == "api.openai.com"
+
+
 def list_available_models(provider: LLMProvider | None = None) -> list[str]:
     """
     List available models for a provider.
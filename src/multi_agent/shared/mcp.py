@@ -9,14 +9,31 @@ data sources and tools. This module provides:
 Learn more: https://modelcontextprotocol.io/
 """
 
+import asyncio
+import base64
+import inspect
 import json
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any, Callable
 from enum import Enum
 
 from loguru import logger
 
+from multi_agent.shared._json import (
+    dumps as _json_dumps,
+    dumps_line as _json_dumps_line,
+    loads as _json_loads,
+)
+
+# Upper bound on requests accepted in one JSON-RPC batch
+DEFAULT_MAX_BATCH = 32
+
+# Read size for chunked resource readers
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
 
 class MCPMessageType(str, Enum):
     """MCP message types."""
@@ -57,19 +74,47 @@ class MCPTool:
         return self.handler(**kwargs)
 
 
+def chunked_file_reader(
+    path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE, binary: bool = False
+) -> Iterator[str | bytes]:
+    """
+    Yield a file's content in chunks, for use as a resource reader.
+
+    Example:
+        >>> server.add_resource(
+        ...     uri="file://notes.md",
+        ...     name="Notes",
+        ...     description="Project notes",
+        ...     reader=functools.partial(chunked_file_reader, "notes.md"),
+        ... )
+    """
+    if binary:
+        with open(path, "rb") as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+    else:
+        with open(path, encoding="utf-8") as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
+
 @dataclass
 class MCPResource:
     """
     MCP Resource definition.
 
-    Represents a data resource that can be read through MCP.
+    Represents a data resource that can be read through MCP. The reader
+    returns the whole content (str or bytes) or an iterable of chunks,
+    so large files need not be loaded up front.
     """
 
     uri: str
     name: str
     description: str
     mime_type: str = "text/plain"
-    reader: Callable[[], str] = field(repr=False, default=lambda: "")
+    reader: Callable[[], str | bytes | Iterable[str | bytes]] = field(
+        repr=False, default=lambda: ""
+    )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to MCP resource format."""
@@ -80,9 +125,16 @@ class MCPResource:
             "mimeType": self.mime_type,
         }
 
-    def read(self) -> str:
-        """Read the resource content."""
-        return self.reader()
+    def read(self) -> str | bytes:
+        """Read the resource content, joining chunks from iterator readers."""
+        data = self.reader()
+        if isinstance(data, (str, bytes)):
+            return data
+
+        chunks = list(data)
+        if chunks and isinstance(chunks[0], bytes):
+            return b"".join(chunks)
+        return "".join(chunks)
 
 
 class MCPServer:
@@ -113,6 +165,15 @@ class MCPServer:
         self.resources: dict[str, MCPResource] = {}
         self._initialized = False
 
+        # Serialized list payloads, rebuilt only after the registry changes
+        self._tools_list_cache: tuple[dict[str, Any], ...] | None = None
+        self._resources_list_cache: tuple[dict[str, Any], ...] | None = None
+
+    def invalidate_tools_cache(self) -> None:
+        """Drop cached tools/list and resources/list payloads."""
+        self._tools_list_cache = None
+        self._resources_list_cache = None
+
     def tool(
         self,
         name: str,
@@ -135,6 +196,7 @@ class MCPServer:
                 input_schema=input_schema,
                 handler=func,
             )
+            self.invalidate_tools_cache()
             logger.debug(f"Registered MCP tool: {name}")
             return func
 
@@ -145,7 +207,7 @@ class MCPServer:
         uri: str,
         name: str,
         description: str,
-        reader: Callable[[], str],
+        reader: Callable[[], str | bytes | Iterable[str | bytes]],
         mime_type: str = "text/plain",
     ) -> None:
         """Add a resource to the server."""
@@ -156,8 +218,28 @@ class MCPServer:
             mime_type=mime_type,
             reader=reader,
         )
+        self.invalidate_tools_cache()
         logger.debug(f"Registered MCP resource: {uri}")
 
+    def call_tool_direct(self, name: str, arguments: dict[str, Any] | None = None) -> str:
+        """
+        Call a registered tool in-process, without a JSON-RPC envelope.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            Tool result as text
+
+        Raises:
+            KeyError: If the tool is not registered
+        """
+        tool = self.tools.get(name)
+        if tool is None:
+            raise KeyError(f"Unknown tool: {name}")
+        return str(tool.call(**(arguments or {})))
+
     def handle_message(self, message: dict[str, Any]) -> dict[str, Any]:
         """
         Handle incoming MCP message.
@@ -170,7 +252,9 @@ class MCPServer:
         """
         method = message.get("method", "")
         msg_id = message.get("id")
-        params = message.get("params", {})
+        params = message.get("params") or {}
+        if not isinstance(params, dict):
+            return self._error_response(msg_id, -32602, "Invalid params: expected an object")
 
         try:
             if method == MCPMessageType.INITIALIZE:
@@ -191,6 +275,134 @@ class MCPServer:
             logger.exception(f"Error handling MCP message: {e}")
             return self._error_response(msg_id, -32603, str(e))
 
+    def handle_batch(
+        self,
+        requests: list[dict[str, Any]],
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ) -> list[dict[str, Any]]:
+        """
+        Handle a JSON-RPC 2.0 batch of MCP messages.
+
+        Notifications (messages without an id) are dispatched but produce
+        no response. Oversized batches and duplicate ids are rejected.
+
+        Args:
+            requests: List of MCP JSON-RPC messages
+            max_batch: Maximum number of messages accepted in one batch
+
+        Returns:
+            List of response messages
+        """
+        messages, responses = self._split_batch(requests, max_batch)
+        for message in messages:
+            response = self.handle_message(message)
+            if message.get("id") is not None:
+                responses.append(response)
+        return responses
+
+    async def ahandle_message(self, message: dict[str, Any]) -> dict[str, Any]:
+        """
+        Handle incoming MCP message without blocking the event loop.
+
+        Coroutine tools are awaited directly; sync tools and resource
+        readers run in a worker thread so independent requests overlap.
+
+        Args:
+            message: MCP JSON-RPC message
+
+        Returns:
+            Response message
+        """
+        method = message.get("method", "")
+        if method == MCPMessageType.RESOURCES_READ:
+            return await asyncio.to_thread(self.handle_message, message)
+        if method != MCPMessageType.TOOLS_CALL:
+            return self.handle_message(message)
+
+        msg_id = message.get("id")
+        params = message.get("params") or {}
+        if not isinstance(params, dict):
+            return self._error_response(msg_id, -32602, "Invalid params: expected an object")
+
+        try:
+            tool = self.tools.get(params.get("name"))
+            if tool is None:
+                return self._error_response(
+                    msg_id, -32602, f"Unknown tool: {params.get('name')}"
+                )
+
+            arguments = params.get("arguments") or {}
+            if inspect.iscoroutinefunction(tool.handler):
+                result = await tool.handler(**arguments)
+            else:
+                result = await asyncio.to_thread(tool.call, **arguments)
+        except Exception as e:
+            logger.exception(f"Error handling MCP message: {e}")
+            return self._error_response(msg_id, -32603, str(e))
+
+        return self._tool_result(msg_id, str(result))
+
+    async def ahandle_batch(
+        self,
+        requests: list[dict[str, Any]],
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ) -> list[dict[str, Any]]:
+        """
+        Handle a JSON-RPC 2.0 batch, dispatching its messages concurrently.
+
+        Applies the same size and duplicate-id checks as handle_batch.
+        """
+        messages, responses = self._split_batch(requests, max_batch)
+        results = await asyncio.gather(*(self.ahandle_message(m) for m in messages))
+        responses.extend(
+            response
+            for message, response in zip(messages, results)
+            if message.get("id") is not None
+        )
+        return responses
+
+    def _split_batch(
+        self, requests: list[dict[str, Any]], max_batch: int
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Separate valid batch messages from error responses for invalid ones."""
+        if not requests:
+            return [], [self._error_response(None, -32600, "Invalid Request: empty batch")]
+        if len(requests) > max_batch:
+            return [], [
+                self._error_response(
+                    None, -32600, f"Invalid Request: batch exceeds {max_batch} messages"
+                )
+            ]
+
+        messages = []
+        errors = []
+        seen_ids = set()
+        for message in requests:
+            if not isinstance(message, dict):
+                errors.append(self._error_response(None, -32600, "Invalid Request"))
+                continue
+
+            msg_id = message.get("id")
+            if msg_id is not None:
+                if not isinstance(msg_id, (str, int)) or isinstance(msg_id, bool):
+                    errors.append(
+                        self._error_response(
+                            None, -32600, "Invalid Request: id must be a string or integer"
+                        )
+                    )
+                    continue
+                if msg_id in seen_ids:
+                    errors.append(
+                        self._error_response(
+                            msg_id, -32600, f"Invalid Request: duplicate id {msg_id}"
+                        )
+                    )
+                    continue
+                seen_ids.add(msg_id)
+            messages.append(message)
+
+        return messages, errors
+
     def _handle_initialize(self, msg_id: Any, params: dict) -> dict:
         """Handle initialize request."""
         self._initialized = True
@@ -212,11 +424,13 @@ class MCPServer:
 
     def _handle_tools_list(self, msg_id: Any) -> dict:
         """Handle tools/list request."""
+        if self._tools_list_cache is None:
+            self._tools_list_cache = tuple(t.to_dict() for t in self.tools.values())
         return {
             "jsonrpc": "2.0",
             "id": msg_id,
             "result": {
-                "tools": [t.to_dict() for t in self.tools.values()],
+                "tools": [dict(t) for t in self._tools_list_cache],
             },
         }
 
@@ -228,23 +442,28 @@ class MCPServer:
         if tool_name not in self.tools:
             return self._error_response(msg_id, -32602, f"Unknown tool: {tool_name}")
 
-        result = self.tools[tool_name].call(**arguments)
+        result = self.call_tool_direct(tool_name, arguments)
+        return self._tool_result(msg_id, result)
 
+    def _tool_result(self, msg_id: Any, text: str) -> dict:
+        """Create tools/call result response."""
         return {
             "jsonrpc": "2.0",
             "id": msg_id,
             "result": {
-                "content": [{"type": "text", "text": str(result)}],
+                "content": [{"type": "text", "text": text}],
             },
         }
 
     def _handle_resources_list(self, msg_id: Any) -> dict:
         """Handle resources/list request."""
+        if self._resources_list_cache is None:
+            self._resources_list_cache = tuple(r.to_dict() for r in self.resources.values())
         return {
             "jsonrpc": "2.0",
             "id": msg_id,
             "result": {
-                "resources": [r.to_dict() for r in self.resources.values()],
+                "resources": [dict(r) for r in self._resources_list_cache],
             },
         }
 
@@ -256,18 +475,18 @@ class MCPServer:
             return self._error_response(msg_id, -32602, f"Unknown resource: {uri}")
 
         content = self.resources[uri].read()
+        entry = {"uri": uri, "mimeType": self.resources[uri].mime_type}
+        if isinstance(content, bytes):
+            # Binary content travels base64-encoded, per the MCP spec
+            entry["blob"] = base64.b64encode(content).decode("ascii")
+        else:
+            entry["text"] = content
 
         return {
             "jsonrpc": "2.0",
             "id": msg_id,
             "result": {
-                "contents": [
-                    {
-                        "uri": uri,
-                        "mimeType": self.resources[uri].mime_type,
-                        "text": content,
-                    }
-                ],
+                "contents": [entry],
             },
         }
 
@@ -284,22 +503,32 @@ class MCPServer:
         Run server with stdio transport.
 
         Reads JSON-RPC messages from stdin, writes responses to stdout.
+        Both streams are used in binary mode, so messages are parsed from
+        and serialized to bytes without a text decode/encode pass.
         """
         import sys
 
         logger.info(f"Starting MCP server '{self.name}' on stdio")
 
+        stdin = sys.stdin.buffer
+        stdout = sys.stdout.buffer
+
         while True:
             try:
-                line = sys.stdin.readline()
+                line = stdin.readline()
                 if not line:
                     break
 
-                message = json.loads(line)
-                response = self.handle_message(message)
+                message = _json_loads(line)
+                if isinstance(message, list):
+                    response = self.handle_batch(message)
+                    if not response:
+                        continue
+                else:
+                    response = self.handle_message(message)
 
-                sys.stdout.write(json.dumps(response) + "\n")
-                sys.stdout.flush()
+                stdout.write(_json_dumps_line(response))
+                stdout.flush()
 
             except json.JSONDecodeError as e:
                 logger.error(f"Invalid JSON: {e}")
@@ -374,11 +603,11 @@ class MCPClient:
         if not self._process:
             raise RuntimeError("Not connected to MCP server")
 
-        self._process.stdin.write(json.dumps(message) + "\n")
+        self._process.stdin.write(_json_dumps(message) + "\n")
         self._process.stdin.flush()
 
         response_line = self._process.stdout.readline()
-        return json.loads(response_line)
+        return _json_loads(response_line)
 
     def list_tools(self) -> list[dict[str, Any]]:
         """List available tools."""
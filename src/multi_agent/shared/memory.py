@@ -11,13 +11,23 @@ agents to "remember" previous interactions.
 
 import threading
 from collections import deque
+from collections.abc import Iterable
+from itertools import islice
 from datetime import datetime
 from typing import Any
 
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    ChatMessage,
+    HumanMessage,
+    SystemMessage,
+)
 from pydantic import BaseModel, Field
 from loguru import logger
 
 from multi_agent.shared.config import settings
+from multi_agent.shared.llm_factory import message_text
 
 
 class Message(BaseModel):
@@ -32,6 +42,50 @@ class Message(BaseModel):
         """Convert to LangChain format."""
         return (self.role, self.content)
 
+    def to_langchain_message(self) -> BaseMessage:
+        """Convert to a LangChain message object."""
+        message_class = _LANGCHAIN_MESSAGE_TYPES.get(self.role)
+        if message_class is None:
+            return ChatMessage(role=self.role, content=self.content)
+        return message_class(content=self.content)
+
+
+# Prompt used by AgentMemory.compact()/acompact() to fold old messages into
+# the summary
+SUMMARY_PROMPT = """Update the summary of a conversation between a user and an AI assistant.
+Keep facts, names, decisions and open questions. Use at most 150 words.
+
+Current summary:
+{summary}
+
+Messages to add:
+{messages}
+
+Updated summary:"""
+
+
+# Length of the message previews kept for history listings
+PREVIEW_LENGTH = 60
+
+
+def make_preview(content: str) -> str:
+    """Shorten content to PREVIEW_LENGTH characters for display."""
+    if len(content) > PREVIEW_LENGTH:
+        return content[:PREVIEW_LENGTH] + "..."
+    return content
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (about 4 tokens per 3 words), no tokenizer needed."""
+    return len(text.split()) * 4 // 3 + 1
+
+
+_LANGCHAIN_MESSAGE_TYPES = {
+    "user": HumanMessage,
+    "assistant": AIMessage,
+    "system": SystemMessage,
+}
+
 
 class AgentMemory:
     """
@@ -52,16 +106,51 @@ class AgentMemory:
         self.agent_name = agent_name
         self._messages: deque[Message] = deque(maxlen=self.max_messages)
         self._system_prompt: str | None = None
+        self._summary: str | None = None
+
+        # LangChain view of the same window, converted once per message
+        self._lc_messages: deque[BaseMessage] = deque(maxlen=self.max_messages)
+        self._lc_system: list[BaseMessage] = []
+
+        # Display previews of the same window, computed once per message
+        self._previews: deque[str] = deque(maxlen=self.max_messages)
 
     def set_system_prompt(self, prompt: str) -> None:
         """Set the system prompt (doesn't count in message limit)."""
         self._system_prompt = prompt
+        self._update_lc_system()
         logger.debug(f"[{self.agent_name}] System prompt set")
 
+    @property
+    def summary(self) -> str | None:
+        """Summary of older messages that left the window, if any."""
+        return self._summary
+
+    def set_summary(self, summary: str | None) -> None:
+        """Set the summary of older messages (doesn't count in message limit)."""
+        self._summary = summary
+        self._update_lc_system()
+        logger.debug(f"[{self.agent_name}] Summary updated")
+
+    def _update_lc_system(self) -> None:
+        """Rebuild the LangChain system messages (prompt + summary)."""
+        self._lc_system = [SystemMessage(content=c) for c in self._system_contents()]
+
+    def _system_contents(self) -> list[str]:
+        """System prompt and summary texts, in prompt order."""
+        contents = []
+        if self._system_prompt:
+            contents.append(self._system_prompt)
+        if self._summary:
+            contents.append(f"Summary of the earlier conversation: {self._summary}")
+        return contents
+
     def add(self, role: str, content: str, **metadata: Any) -> None:
         """Add a message to memory."""
         msg = Message(role=role, content=content, metadata=metadata)
         self._messages.append(msg)
+        self._lc_messages.append(msg.to_langchain_message())
+        self._previews.append(make_preview(content))
         logger.debug(f"[{self.agent_name}] Added message: {role[:20]}...")
 
     def add_user(self, content: str, **metadata: Any) -> None:
@@ -81,21 +170,135 @@ class AgentMemory:
         """
         messages = []
 
-        if include_system and self._system_prompt:
-            messages.append(("system", self._system_prompt))
+        if include_system:
+            messages.extend(("system", content) for content in self._system_contents())
 
         for msg in self._messages:
             messages.append(msg.to_langchain())
 
         return messages
 
+    def langchain_messages(self, include_system: bool = True) -> list[BaseMessage]:
+        """
+        Return messages as LangChain message objects, ready for an LLM call.
+
+        Messages are converted once when added, so this only assembles
+        the list. The returned objects are shared; don't mutate them.
+        """
+        if include_system:
+            return [*self._lc_system, *self._lc_messages]
+        return list(self._lc_messages)
+
     def get_last_n(self, n: int) -> list[Message]:
         """Return the last N messages."""
-        return list(self._messages)[-n:]
+        return list(islice(self._messages, max(len(self._messages) - n, 0), None))
+
+    def get_previews(self) -> list[tuple[str, str]]:
+        """Return (role, preview) pairs for all messages, for display."""
+        return [(msg.role, preview) for msg, preview in zip(self._messages, self._previews)]
+
+    def pop_oldest(self, n: int) -> list[Message]:
+        """Remove and return the N oldest messages (e.g. to summarize them)."""
+        popped = []
+        for _ in range(min(n, len(self._messages))):
+            popped.append(self._messages.popleft())
+            self._lc_messages.popleft()
+            self._previews.popleft()
+        return popped
+
+    def estimate_tokens(self) -> int:
+        """Approximate prompt size of system prompt, summary and messages."""
+        texts = [*self._system_contents(), *(msg.content for msg in self._messages)]
+        return sum(estimate_tokens(text) for text in texts)
+
+    def compact(
+        self,
+        llm,
+        max_tokens: int,
+        keep_recent: int = 8,
+        keep_sinks: int = 4,
+    ) -> bool:
+        """
+        Summarize the middle of the conversation when it exceeds a budget.
+
+        The first `keep_sinks` messages (which usually set up the task) and
+        the last `keep_recent` messages are kept verbatim; everything in
+        between is folded into the summary with one LLM call. Later turns
+        reuse the summary, so the cost is paid once per compaction.
+
+        Args:
+            llm: Chat model used to write the summary
+            max_tokens: Estimated token budget for the whole prompt
+            keep_recent: Recent messages always kept
+            keep_sinks: Oldest messages always kept
+
+        Returns:
+            True if messages were summarized
+        """
+        plan = self._plan_compaction(max_tokens, keep_recent, keep_sinks)
+        if plan is None:
+            return False
+        response = llm.invoke([HumanMessage(content=self._summary_prompt(plan[1]))])
+        self._apply_compaction(plan, message_text(response))
+        return True
+
+    async def acompact(
+        self,
+        llm,
+        max_tokens: int,
+        keep_recent: int = 8,
+        keep_sinks: int = 4,
+    ) -> bool:
+        """Async version of compact(), for use inside an event loop."""
+        plan = self._plan_compaction(max_tokens, keep_recent, keep_sinks)
+        if plan is None:
+            return False
+        response = await llm.ainvoke([HumanMessage(content=self._summary_prompt(plan[1]))])
+        self._apply_compaction(plan, message_text(response))
+        return True
+
+    def _plan_compaction(
+        self, max_tokens: int, keep_recent: int, keep_sinks: int
+    ) -> tuple[list[Message], list[Message]] | None:
+        """Split messages into (kept, summarized), or None if nothing to do."""
+        if self.estimate_tokens() <= max_tokens:
+            return None
+
+        messages = list(self._messages)
+        # Never cut into the sinks, even when keep_recent exceeds the history
+        end = max(len(messages) - keep_recent, keep_sinks)
+        middle = messages[keep_sinks:end]
+        if not middle:
+            return None
+        return messages[:keep_sinks] + messages[end:], middle
+
+    def _summary_prompt(self, middle: list[Message]) -> str:
+        return SUMMARY_PROMPT.format(
+            summary=self._summary or "(none)",
+            messages="\n".join(f"{msg.role}: {msg.content}" for msg in middle),
+        )
+
+    def _apply_compaction(
+        self, plan: tuple[list[Message], list[Message]], summary: str
+    ) -> None:
+        kept, middle = plan
+        self._messages = deque(kept, maxlen=self.max_messages)
+        self._lc_messages = deque(
+            (msg.to_langchain_message() for msg in kept), maxlen=self.max_messages
+        )
+        self._previews = deque(
+            (make_preview(msg.content) for msg in kept), maxlen=self.max_messages
+        )
+        self.set_summary(summary.strip())
+
+        logger.info(f"[{self.agent_name}] Compacted {len(middle)} messages into summary")
 
     def clear(self) -> None:
-        """Clear memory (keeps system prompt)."""
+        """Clear memory and summary (keeps system prompt)."""
         self._messages.clear()
+        self._lc_messages.clear()
+        self._previews.clear()
+        self.set_summary(None)
         logger.info(f"[{self.agent_name}] Memory cleared")
 
     def __len__(self) -> int:
@@ -161,6 +364,16 @@ class SharedMemory:
             else:
                 raise TypeError(f"Key '{key}' is not a list")
 
+    def extend(self, key: str, values: Iterable[Any]) -> None:
+        """Append several values to a list under one lock (creates if doesn't exist)."""
+        with self._store_lock:
+            if key not in self._store:
+                self._store[key] = []
+            if isinstance(self._store[key], list):
+                self._store[key].extend(values)
+            else:
+                raise TypeError(f"Key '{key}' is not a list")
+
     def get_all(self) -> dict[str, Any]:
         """Return copy of all memory."""
         with self._store_lock:
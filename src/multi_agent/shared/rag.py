@@ -5,11 +5,14 @@ Provides document storage and retrieval capabilities using ChromaDB
 for semantic search. Agents can use this to access relevant knowledge.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from loguru import logger
 
+from multi_agent.shared.llm_factory import message_text
+
 try:
     import chromadb
     from chromadb.config import Settings as ChromaSettings
@@ -20,6 +23,30 @@ except ImportError:
     logger.warning("ChromaDB not installed. RAG features disabled.")
 
 
+# HNSW index settings for new collections. construction_ef and M above
+# Chroma's defaults (100 and 16) build a denser graph for better recall;
+# search_ef keeps Chroma's default of 100.
+DEFAULT_HNSW_SETTINGS = {
+    "hnsw:space": "cosine",  # Use cosine similarity
+    "hnsw:construction_ef": 200,
+    "hnsw:M": 32,
+}
+
+
+@lru_cache(maxsize=1)
+def get_default_embedding_function():
+    """
+    Return the process-wide default embedding function.
+
+    The embedding model is loaded on first use and shared by every RAGStore,
+    so creating more stores or collections does not load the weights again.
+    Chroma's default function embeds each add/query call in batches.
+    """
+    from chromadb.utils import embedding_functions
+
+    return embedding_functions.DefaultEmbeddingFunction()
+
+
 class RAGStore:
     """
     Document store with semantic search for RAG.
@@ -41,6 +68,8 @@ class RAGStore:
         self,
         collection_name: str = "default",
         persist_directory: str | None = None,
+        embedding_function=None,
+        hnsw_settings: dict[str, Any] | None = None,
     ):
         """
         Initialize RAG store.
@@ -48,12 +77,20 @@ class RAGStore:
         Args:
             collection_name: Name of the ChromaDB collection
             persist_directory: Path for persistent storage (None = in-memory)
+            embedding_function: ChromaDB embedding function
+                (default: shared get_default_embedding_function())
+            hnsw_settings: Overrides for DEFAULT_HNSW_SETTINGS
+                (e.g. {"hnsw:search_ef": 128}). Only applied when the
+                collection is created: an existing persisted collection
+                keeps the settings it was built with.
         """
         if not HAS_CHROMADB:
             raise ImportError("ChromaDB required. Install with: pip install chromadb")
 
         self.collection_name = collection_name
         self.persist_directory = persist_directory
+        self.embedding_function = embedding_function or get_default_embedding_function()
+        self.hnsw_settings = {**DEFAULT_HNSW_SETTINGS, **(hnsw_settings or {})}
 
         # Create client
         if persist_directory:
@@ -68,7 +105,8 @@ class RAGStore:
         # Get or create collection
         self.collection = self.client.get_or_create_collection(
             name=collection_name,
-            metadata={"hnsw:space": "cosine"},  # Use cosine similarity
+            metadata=self.hnsw_settings,
+            embedding_function=self.embedding_function,
         )
 
     def add_documents(
@@ -157,30 +195,55 @@ class RAGStore:
         Returns:
             List of results with document, metadata, and distance
         """
+        return self.search_batch([query], n_results=n_results, where=where)[0]
+
+    def search_batch(
+        self,
+        queries: list[str],
+        n_results: int = 3,
+        where: dict | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Search for several queries with a single ChromaDB call.
+
+        All queries are embedded together and looked up in one request,
+        which is cheaper than calling search() once per query.
+
+        Args:
+            queries: Search queries
+            n_results: Number of results per query
+            where: Optional filter criteria
+
+        Returns:
+            One result list per query, in the same order as `queries`
+        """
         results = self.collection.query(
-            query_texts=[query],
+            query_texts=queries,
             n_results=n_results,
             where=where,
         )
 
         # Format results
-        formatted = []
-        if results and results["documents"]:
-            for i, doc in enumerate(results["documents"][0]):
-                formatted.append(
-                    {
-                        "document": doc,
-                        "id": results["ids"][0][i] if results["ids"] else None,
-                        "metadata": (
-                            results["metadatas"][0][i] if results["metadatas"] else {}
-                        ),
-                        "distance": (
-                            results["distances"][0][i] if results["distances"] else None
-                        ),
-                    }
-                )
-
-        return formatted
+        batches = []
+        for q in range(len(queries)):
+            formatted = []
+            if results and results["documents"]:
+                for i, doc in enumerate(results["documents"][q]):
+                    formatted.append(
+                        {
+                            "document": doc,
+                            "id": results["ids"][q][i] if results["ids"] else None,
+                            "metadata": (
+                                results["metadatas"][q][i] if results["metadatas"] else {}
+                            ),
+                            "distance": (
+                                results["distances"][q][i] if results["distances"] else None
+                            ),
+                        }
+                    )
+            batches.append(formatted)
+
+        return batches
 
     def delete(self, ids: list[str]) -> None:
         """Delete documents by ID."""
@@ -192,7 +255,9 @@ class RAGStore:
         # ChromaDB doesn't have a clear method, so recreate collection
         self.client.delete_collection(self.collection_name)
         self.collection = self.client.create_collection(
-            name=self.collection_name, metadata={"hnsw:space": "cosine"}
+            name=self.collection_name,
+            metadata=self.hnsw_settings,
+            embedding_function=self.embedding_function,
         )
         logger.info(f"Cleared collection '{self.collection_name}'")
 
@@ -273,13 +338,4 @@ Answer:"""
         # Generate response
         response = self.llm.invoke(messages)
 
-        content = response.content
-        if isinstance(content, list):
-            # Gemini format: [{'type': 'text', 'text': '...', 'index': 0}]
-            content = "".join(
-                item.get("text", "")
-                for item in content
-                if isinstance(item, dict) and item.get("type") == "text"
-            )
-
-        return content
+        return message_text(response)
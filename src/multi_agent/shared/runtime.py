@@ -0,0 +1,113 @@
+"""
+Event loop helpers.
+
+asyncio.run() creates and closes a new loop on every call, which also
+throws away the default executor and any open HTTP connection pools.
+Scripts that call the *_sync helpers in a loop reuse one loop per thread
+instead, so the helpers stay safe to call from several threads at once.
+
+Async HTTP connections belong to the loop that opened them, so objects
+holding an async client are cached per loop with LoopLocalCache.
+
+new_event_loop() is the loop factory for long-running entry points: it
+returns uvloop's loop when installed (pip install multi-agent-system[speedups]).
+"""
+
+import asyncio
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine, Hashable
+from typing import Any, TypeVar
+
+try:
+    import uvloop
+
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+T = TypeVar("T")
+
+_local = threading.local()
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a new event loop, using uvloop when it is installed.
+
+    Pass it to web.run_app(loop=...) or asyncio.Runner(loop_factory=...)
+    rather than changing the global event loop policy.
+    """
+    if HAS_UVLOOP:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def _get_runner() -> asyncio.Runner:
+    """Return this thread's runner, creating it on first use."""
+    runner = getattr(_local, "runner", None)
+    if runner is None:
+        runner = _local.runner = asyncio.Runner()
+        # Close the loop when the thread goes away (or at exit for the main one)
+        weakref.finalize(threading.current_thread(), runner.close)
+    return runner
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on this thread's event loop.
+
+    Must not be called from inside a running event loop; use await there.
+    """
+    return _get_runner().run(coro)
+
+
+class LoopLocalCache:
+    """
+    LRU cache with a separate store for each running event loop.
+
+    Values created while a loop runs are only returned on that loop, and
+    are dropped together with the loop. Calls made outside any loop share
+    one store of their own.
+    """
+
+    def __init__(self, maxsize: int = 8):
+        self.maxsize = maxsize
+        self._by_loop: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, OrderedDict] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._no_loop: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _store(self) -> OrderedDict:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._no_loop
+        store = self._by_loop.get(loop)
+        if store is None:
+            store = self._by_loop[loop] = OrderedDict()
+        return store
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], T]) -> T:
+        """Return the value cached for `key` on this loop, creating it if needed."""
+        with self._lock:
+            store = self._store()
+            value = store.get(key)
+            if value is not None:
+                store.move_to_end(key)
+                return value
+
+        value = factory()
+        with self._lock:
+            value = store.setdefault(key, value)
+            store.move_to_end(key)
+            if len(store) > self.maxsize:
+                store.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Forget all cached values on every loop."""
+        with self._lock:
+            self._by_loop.clear()
+            self._no_loop.clear()
@@ -18,6 +18,7 @@ from multi_agent.tools.common_tools import (
     encode_base64,
     decode_base64,
     # Collections and helpers
+    evaluate_expression,
     ALL_TOOLS,
     get_tools_for_agent,
     list_available_skills,
@@ -43,6 +44,7 @@ __all__ = [
     "encode_base64",
     "decode_base64",
     # Collections and helpers
+    "evaluate_expression",
     "ALL_TOOLS",
     "get_tools_for_agent",
     "list_available_skills",
@@ -14,14 +14,49 @@ Skills include:
 - Web search (mock)
 """
 
+import ast
 import os
 import re
 import json
+import operator
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from langchain_core.tools import tool
 
+# Operators accepted by evaluate_expression
+_BINARY_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+_UNARY_OPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+
+
+def _eval_node(node: ast.AST) -> int | float:
+    """Evaluate an arithmetic AST node, rejecting anything else."""
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+        return _BINARY_OPS[type(node.op)](_eval_node(node.left), _eval_node(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        return _UNARY_OPS[type(node.op)](_eval_node(node.operand))
+    raise ValueError("Unsupported expression")
+
+
+@lru_cache(maxsize=256)
+def evaluate_expression(expression: str) -> int | float:
+    """
+    Evaluate an arithmetic expression without eval().
+
+    The expression is parsed to an AST and only numbers, + - * / and
+    parentheses are evaluated. Results are cached, so repeated calls
+    skip parsing entirely.
+    """
+    return _eval_node(ast.parse(expression, mode="eval").body)
+
 
 @tool
 def calculate(expression: str) -> str:
@@ -35,12 +70,11 @@ def calculate(expression: str) -> str:
         Calculation result as string
     """
     try:
-        # Safe eval only for numeric expressions
+        # Only numeric expressions are accepted
         allowed_chars = set("0123456789+-*/.() ")
         if not all(c in allowed_chars for c in expression):
             return "Error: invalid expression. Use only numbers and operators +-*/."
-        result = eval(expression)
-        return f"Result: {result}"
+        return f"Result: {evaluate_expression(expression)}"
     except Exception as e:
         return f"Calculation error: {e}"
 
@@ -0,0 +1,101 @@
+"""Tests for the A2A protocol models."""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from multi_agent.shared.a2a import A2AClient, A2AMessage, A2AServer, A2ATask, AgentCard
+
+
+class TestA2AMessage:
+    """Test A2A messages."""
+
+    def test_metadata_keeps_value_types(self):
+        """Equal-comparing values of different types are not merged."""
+        A2AMessage(metadata={"p": 1})
+        message = A2AMessage(metadata={"p": True})
+        assert message.to_dict()["metadata"]["p"] is True
+
+    def test_metadata_is_mutable(self):
+        """Metadata can be updated after the message is built."""
+        message = A2AMessage(metadata={"priority": "low"})
+        message.metadata["priority"] = "high"
+        assert message.to_dict()["metadata"] == {"priority": "high"}
+
+
+class TestA2AServerHistory:
+    """Test task history bounds."""
+
+    def test_running_tasks_are_not_evicted(self):
+        """Only finished tasks make room for new ones."""
+
+        async def scenario():
+            server = A2AServer(AgentCard("t", "d", "http://test"), max_tasks=1)
+            release = asyncio.Event()
+
+            @server.on_task
+            async def handle(task: A2ATask) -> str:
+                await release.wait()
+                return "done"
+
+            _, first = await server.handle_request("POST", "/tasks", {"description": "a"})
+            _, second = await server.handle_request("POST", "/tasks", {"description": "b"})
+            await asyncio.sleep(0)
+            assert first["id"] in server.tasks and second["id"] in server.tasks
+
+            release.set()
+            status, body = await server.handle_request("GET", f"/tasks/{first['id']}/wait")
+            assert status == 200 and body["state"] == "completed"
+
+            # Both finished; a new task evicts the oldest finished one
+            await server.handle_request("GET", f"/tasks/{second['id']}/wait")
+            await server.handle_request("POST", "/tasks", {"description": "c"})
+            assert first["id"] not in server.tasks
+
+        asyncio.run(scenario())
+
+
+class TestA2AClientWait:
+    """Test A2AClient.wait_for_task against a local server."""
+
+    @staticmethod
+    async def serve(server: A2AServer, long_poll: bool = True):
+        from aiohttp import web
+        from aiohttp.test_utils import TestServer
+
+        async def handle(request: web.Request) -> web.Response:
+            if not long_poll and request.path.endswith("/wait"):
+                raise web.HTTPNotFound()
+            status, body = await server.handle_request(request.method, request.path, None)
+            return web.json_response(body, status=status)
+
+        app = web.Application()
+        app.router.add_route("*", "/{path:.*}", handle)
+        test_server = TestServer(app)
+        await test_server.start_server()
+        return test_server
+
+    def test_unknown_task_fails_fast(self):
+        """A task the server doesn't know raises instead of polling to the timeout."""
+
+        async def scenario(long_poll: bool):
+            server = A2AServer(AgentCard("t", "d", "http://test"))
+            test_server = await self.serve(server, long_poll)
+            client = A2AClient()
+            try:
+                url = str(test_server.make_url("")).rstrip("/")
+                with pytest.raises(ValueError, match="Task not found"):
+                    await client.wait_for_task(url, "missing", timeout=5)
+            finally:
+                await client.close()
+                await test_server.close()
+
+        for long_poll in (True, False):
+            started = time.monotonic()
+            asyncio.run(scenario(long_poll))
+            assert time.monotonic() - started < 2
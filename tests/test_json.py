@@ -0,0 +1,20 @@
+"""Tests for the shared JSON helpers."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from multi_agent.shared import _json
+
+
+def test_non_str_keys_round_trip():
+    payload = {1: "a", "b": [1, 2.5, None]}
+    assert _json.loads(_json.dumps(payload)) == {"1": "a", "b": [1, 2.5, None]}
+    assert _json.loads(_json.dumps_bytes(payload)) == _json.loads(_json.dumps(payload))
+
+
+def test_dumps_line_is_newline_terminated():
+    line = _json.dumps_line({"id": 1})
+    assert line.endswith(b"\n") and line.count(b"\n") == 1
+    assert _json.loads(line) == {"id": 1}
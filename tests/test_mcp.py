@@ -0,0 +1,93 @@
+"""Tests for the MCP server."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from multi_agent.shared.mcp import MCPServer
+
+
+def make_server() -> MCPServer:
+    server = MCPServer(name="test")
+
+    @server.tool(
+        name="echo",
+        description="Echo the text",
+        input_schema={"type": "object", "properties": {"text": {"type": "string"}}},
+    )
+    def echo(text: str) -> str:
+        return text
+
+    return server
+
+
+class TestMCPParams:
+    """Test params validation on both dispatch paths."""
+
+    def test_null_params(self):
+        """params: null is an empty object for sync and async calls."""
+        server = make_server()
+        message = {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": None}
+        sync_response = server.handle_message(message)
+        async_response = asyncio.run(server.ahandle_message(message))
+        assert sync_response["error"]["code"] == -32602
+        assert async_response == sync_response
+
+    def test_non_object_params(self):
+        """Non-object params get an Invalid params error."""
+        server = make_server()
+        message = {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": [1]}
+        assert server.handle_message(message)["error"]["code"] == -32602
+        responses = asyncio.run(server.ahandle_batch([message]))
+        assert responses[0]["error"]["code"] == -32602
+
+    def test_async_tool_call(self):
+        """tools/call on the async path returns the tool result."""
+        server = make_server()
+        message = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {"name": "echo", "arguments": {"text": "hi"}},
+        }
+        response = asyncio.run(server.ahandle_message(message))
+        assert response["result"]["content"][0]["text"] == "hi"
+
+
+class TestMCPBatch:
+    """Test JSON-RPC batch validation."""
+
+    def test_invalid_id_type(self):
+        """An unhashable id is rejected for that entry only."""
+        server = make_server()
+        batch = [
+            {"jsonrpc": "2.0", "id": [1], "method": "tools/list"},
+            {"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+        ]
+        for responses in (server.handle_batch(batch), asyncio.run(server.ahandle_batch(batch))):
+            assert responses[0]["error"]["code"] == -32600
+            assert responses[1]["id"] == 2 and "result" in responses[1]
+
+    def test_duplicate_id(self):
+        """A repeated id is rejected."""
+        server = make_server()
+        message = {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+        responses = server.handle_batch([message, dict(message)])
+        assert [r.get("error", {}).get("code") for r in responses] == [-32600, None]
+
+
+class TestMCPListCache:
+    """Test cached tools/list payloads."""
+
+    def test_response_mutation_does_not_leak(self):
+        """Editing one response leaves later responses intact."""
+        server = make_server()
+        message = {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+        first = server.handle_message(message)["result"]["tools"]
+        first[0]["name"] = "changed"
+        first.clear()
+
+        tools = server.handle_message(message)["result"]["tools"]
+        assert [t["name"] for t in tools] == ["echo"]
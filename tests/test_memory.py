@@ -1,5 +1,7 @@
 """Tests for memory system."""
 
+import asyncio
+
 import pytest
 import sys
 from pathlib import Path
@@ -56,6 +58,125 @@ class TestAgentMemory:
         messages = memory.get_messages()
         assert len(messages) == 1
 
+    def test_pop_oldest(self):
+        """Test removing the oldest messages."""
+        memory = AgentMemory(max_messages=5, agent_name="test")
+        for i in range(4):
+            memory.add_user(f"Message {i}")
+
+        popped = memory.pop_oldest(3)
+
+        assert [m.content for m in popped] == ["Message 0", "Message 1", "Message 2"]
+        assert len(memory) == 1
+        assert memory.pop_oldest(5)[0].content == "Message 3"
+        assert len(memory) == 0
+
+    def test_langchain_messages(self):
+        """Test LangChain message objects follow the memory window."""
+        memory = AgentMemory(max_messages=2, agent_name="test")
+        memory.set_system_prompt("System")
+        memory.add_user("Hello")
+        memory.add_assistant("Hi!")
+        memory.add_user("Bye")
+
+        messages = memory.langchain_messages()
+        assert [m.type for m in messages] == ["system", "ai", "human"]
+        assert messages[-1].content == "Bye"
+        assert len(memory.langchain_messages(include_system=False)) == 2
+
+        memory.clear()
+        assert len(memory.langchain_messages()) == 1
+
+    def test_previews(self):
+        """Test previews are shortened and follow the window."""
+        memory = AgentMemory(max_messages=2, agent_name="test")
+        memory.add_user("short")
+        memory.add_assistant("x" * 100)
+        memory.add_user("last")
+
+        previews = memory.get_previews()
+        assert previews == [("assistant", "x" * 60 + "..."), ("user", "last")]
+        assert [m.content for m in memory.get_last_n(1)] == ["last"]
+        assert len(memory.get_last_n(10)) == 2
+
+    def test_summary(self):
+        """Test summary of older messages."""
+        memory = create_agent_memory("test", "System")
+        memory.set_summary("User asked about lists")
+        memory.add_user("And tuples?")
+
+        messages = memory.get_messages()
+        assert [role for role, _ in messages] == ["system", "system", "user"]
+        assert "User asked about lists" in messages[1][1]
+
+        memory.clear()
+        assert memory.summary is None
+
+
+class FakeSummaryLLM:
+    """Minimal chat model returning a fixed summary."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        return type("Response", (), {"content": "Short summary"})()
+
+    async def ainvoke(self, messages):
+        return self.invoke(messages)
+
+
+class TestMemoryCompaction:
+    """Test memory compaction."""
+
+    def test_compact_under_budget(self):
+        """Test nothing happens under the token budget."""
+        memory = AgentMemory(max_messages=20, agent_name="test")
+        memory.add_user("Hello")
+        llm = FakeSummaryLLM()
+
+        assert memory.compact(llm, max_tokens=1000) is False
+        assert llm.calls == 0
+
+    def test_compact_keeps_sinks_and_recent(self):
+        """Test the middle of the conversation is summarized."""
+        memory = AgentMemory(max_messages=20, agent_name="test")
+        for i in range(10):
+            memory.add_user(f"Message {i} " + "word " * 20)
+        llm = FakeSummaryLLM()
+
+        assert memory.compact(llm, max_tokens=50, keep_recent=3, keep_sinks=2) is True
+
+        contents = [m.content.split()[1] for m in memory.get_last_n(10)]
+        assert contents == ["0", "1", "7", "8", "9"]
+        assert memory.summary == "Short summary"
+        assert len(memory.langchain_messages()) == 6  # summary + 5 messages
+        assert llm.calls == 1
+
+    def test_compact_keep_recent_exceeds_history(self):
+        """Test nothing is summarized when all messages are recent."""
+        memory = AgentMemory(max_messages=20, agent_name="test")
+        for i in range(5):
+            memory.add_user(f"Message {i} " + "word " * 20)
+        llm = FakeSummaryLLM()
+
+        assert memory.compact(llm, max_tokens=10, keep_recent=6, keep_sinks=0) is False
+        assert len(memory) == 5
+        assert llm.calls == 0
+
+    def test_acompact(self):
+        """Test the async variant summarizes like compact()."""
+        memory = AgentMemory(max_messages=20, agent_name="test")
+        for i in range(6):
+            memory.add_user(f"Message {i} " + "word " * 20)
+        llm = FakeSummaryLLM()
+
+        assert asyncio.run(memory.acompact(llm, max_tokens=0, keep_recent=3, keep_sinks=0))
+
+        assert [m.content.split()[1] for m in memory.get_last_n(10)] == ["3", "4", "5"]
+        assert memory.summary == "Short summary"
+
 
 class TestSharedMemory:
     """Test shared memory."""
@@ -94,6 +215,20 @@ class TestSharedMemory:
         log = shared.get("log")
         assert log == ["entry1", "entry2"]
 
+    def test_extend(self):
+        """Test extend of a list."""
+        shared = SharedMemory()
+        shared.clear()
+
+        shared.append("log", "entry1")
+        shared.extend("log", ["entry2", "entry3"])
+
+        assert shared.get("log") == ["entry1", "entry2", "entry3"]
+
+        shared.set("scalar", 1)
+        with pytest.raises(TypeError):
+            shared.extend("scalar", [2])
+
     def test_delete(self):
         """Test delete."""
         shared = SharedMemory()
@@ -0,0 +1,134 @@
+"""Tests for LangGraph agent nodes."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph import StateGraph, END
+
+from multi_agent.langgraph_agents.nodes import (
+    CACHED_RESPONSE_EVENT,
+    AgentNode,
+    AgentState,
+    create_agent_node,
+)
+
+
+class FakeToolModel(FakeMessagesListChatModel):
+    """Scripted chat model that accepts bound tools and counts its calls."""
+
+    calls: int = 0
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, *args, **kwargs):
+        self.calls += 1
+        return super()._generate(*args, **kwargs)
+
+
+def tool_call(name: str, args: dict, call_id: str) -> AIMessage:
+    return AIMessage(content="", tool_calls=[{"name": name, "args": args, "id": call_id}])
+
+
+def state(*messages) -> AgentState:
+    return {
+        "messages": list(messages),
+        "current_agent": "",
+        "task_complete": False,
+        "final_output": "",
+    }
+
+
+def run(node: AgentNode, agent_state: AgentState) -> list:
+    return asyncio.run(node(agent_state))["messages"]
+
+
+class TestResultCache:
+    """Test AgentNode result caching."""
+
+    def test_hit_skips_model(self):
+        """The same conversation is answered from the cache."""
+        llm = FakeToolModel(responses=[AIMessage(content="first"), AIMessage(content="second")])
+        node = AgentNode("reviewer", "Review.", llm=llm)
+
+        first = run(node, state(HumanMessage(content="hi")))
+        second = run(node, state(HumanMessage(content="hi")))
+
+        assert llm.calls == 1
+        assert second[-1].content == first[-1].content == "first"
+        assert second[-1].id is None
+
+    def test_message_type_is_part_of_key(self):
+        """Same text from a different role is a miss."""
+        llm = FakeToolModel(responses=[AIMessage(content="first"), AIMessage(content="second")])
+        node = AgentNode("reviewer", "Review.", llm=llm)
+
+        run(node, state(HumanMessage(content="hi")))
+        result = run(node, state(AIMessage(content="hi")))
+
+        assert llm.calls == 2
+        assert result[-1].content == "second"
+
+    def test_hit_replays_tool_trail(self):
+        """A cached turn returns its tool calls and results too."""
+        llm = FakeToolModel(
+            responses=[tool_call("calculate", {"expression": "2 + 2"}, "c1"), AIMessage(content="4")]
+        )
+        node = create_agent_node("coder", "coder", llm)
+
+        first = run(node, state(HumanMessage(content="2 + 2?")))
+        second = run(node, state(HumanMessage(content="2 + 2?")))
+
+        assert llm.calls == 2
+        assert [type(m) for m in second] == [type(m) for m in first]
+        assert len(second) == 3
+
+    def test_file_tools_are_not_cached(self, tmp_path):
+        """Turns that read or write files always run again."""
+        path = tmp_path / "notes.txt"
+        path.write_text("v1")
+        responses = [
+            tool_call("read_file", {"file_path": str(path)}, "r1"),
+            AIMessage(content="read"),
+        ]
+        llm = FakeToolModel(responses=responses * 2)
+        node = create_agent_node("coder", "coder", llm)
+
+        run(node, state(HumanMessage(content="read it")))
+        path.write_text("v2")
+        result = run(node, state(HumanMessage(content="read it")))
+
+        assert llm.calls == 4
+        assert "v2" in result[1].content
+
+    def test_hit_is_reported_to_event_stream(self):
+        """A cache hit still shows up in astream_events."""
+        llm = FakeToolModel(responses=[AIMessage(content="answer")])
+        node = AgentNode("reviewer", "Review.", llm=llm)
+
+        workflow = StateGraph(AgentState)
+        workflow.add_node("reviewer", node)
+        workflow.set_entry_point("reviewer")
+        workflow.add_edge("reviewer", END)
+        graph = workflow.compile()
+
+        async def cached_events():
+            await graph.ainvoke(state(HumanMessage(content="hi")))
+            return [
+                event
+                async for event in graph.astream_events(
+                    state(HumanMessage(content="hi")), version="v2"
+                )
+                if event["event"] == "on_custom_event"
+            ]
+
+        events = asyncio.run(cached_events())
+
+        assert [e["name"] for e in events] == [CACHED_RESPONSE_EVENT]
+        assert events[0]["data"]["content"] == "answer"
+        assert events[0]["metadata"]["langgraph_node"] == "reviewer"
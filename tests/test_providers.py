@@ -1,5 +1,7 @@
 """Tests for LLM providers."""
 
+import asyncio
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -8,8 +10,17 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from multi_agent.shared.config import Settings, LLMProvider
-from multi_agent.shared.llm_factory import create_llm, LLMType, RECOMMENDED_MODELS
+from multi_agent.shared.config import Settings, LLMProvider, settings
+from multi_agent.shared.llm_factory import (
+    create_llm,
+    cached_system_message,
+    enable_prompt_cache,
+    get_llm_provider,
+    get_text_extractor,
+    message_text,
+    LLMType,
+    RECOMMENDED_MODELS,
+)
 
 
 class TestSettings:
@@ -47,6 +58,100 @@ class TestLLMFactory:
         # llm = create_llm(provider=LLMProvider.OLLAMA, model="mistral")
         # assert mock_create.called
 
+    @patch("multi_agent.shared.llm_factory._create_ollama_llm")
+    def test_create_llm_reuses_instance(self, mock_create):
+        """Same parameters share one instance, unhashable ones don't."""
+        mock_create.side_effect = lambda *args, **kwargs: Mock()
+
+        llm1 = create_llm(provider=LLMProvider.OLLAMA, model="cache-test")
+        llm2 = create_llm(provider=LLMProvider.OLLAMA, model="cache-test")
+        llm3 = create_llm(provider=LLMProvider.OLLAMA, model="cache-test", client_kwargs={})
+
+        assert llm1 is llm2
+        assert llm3 is not llm1
+
+    @patch("multi_agent.shared.llm_factory._create_ollama_llm")
+    def test_create_llm_skips_cache_for_client(self, mock_create):
+        """An explicit client object is never shared with other callers."""
+        mock_create.side_effect = lambda *args, **kwargs: Mock()
+        client = object()
+
+        llm1 = create_llm(provider=LLMProvider.OLLAMA, model="client-test", http_client=client)
+        llm2 = create_llm(provider=LLMProvider.OLLAMA, model="client-test", http_client=client)
+
+        assert llm1 is not llm2
+
+    @patch("multi_agent.shared.llm_factory._create_ollama_llm")
+    def test_create_llm_per_event_loop(self, mock_create):
+        """Each event loop gets its own instance, reused within the loop."""
+        mock_create.side_effect = lambda *args, **kwargs: Mock()
+
+        async def create_twice():
+            llm = create_llm(provider=LLMProvider.OLLAMA, model="loop-test")
+            assert create_llm(provider=LLMProvider.OLLAMA, model="loop-test") is llm
+            return llm
+
+        assert asyncio.run(create_twice()) is not asyncio.run(create_twice())
+
+    @patch("multi_agent.shared.llm_factory._create_ollama_llm")
+    def test_create_llm_follows_settings(self, mock_create):
+        """A settings change builds a new instance."""
+        mock_create.side_effect = lambda *args, **kwargs: Mock()
+
+        llm1 = create_llm(provider=LLMProvider.OLLAMA, model="settings-test")
+        with patch.object(settings, "ollama_host", "http://other:11434"):
+            llm2 = create_llm(provider=LLMProvider.OLLAMA, model="settings-test")
+
+        assert llm2 is not llm1
+
+
+class TestMessageText:
+    """Test response text extraction."""
+
+    def test_string_content(self):
+        """Plain string content is returned as is."""
+        assert message_text(Mock(content="Hello")) == "Hello"
+
+    def test_block_content(self):
+        """Text blocks are joined, other blocks skipped."""
+        content = [
+            {"type": "text", "text": "Hello "},
+            {"type": "tool_use", "id": "1"},
+            {"type": "text", "text": "world"},
+        ]
+        assert message_text(Mock(content=content)) == "Hello world"
+
+    def test_default_extractor(self):
+        """Unknown models use the generic extractor."""
+        assert get_text_extractor(object()) is message_text
+
+
+class TestPromptCaching:
+    """Test provider-aware prompt caching helpers."""
+
+    def test_provider_from_bound_model(self):
+        """Bound models are unwrapped to the chat model class."""
+        ChatAnthropic = type("ChatAnthropic", (), {})
+        bound = Mock(spec=["bound"], bound=ChatAnthropic())
+        assert get_llm_provider(bound) == LLMProvider.ANTHROPIC
+
+    def test_anthropic_system_message_has_cache_marker(self):
+        """Anthropic system prompts carry a cache_control block."""
+        msg = cached_system_message("Be brief.", LLMProvider.ANTHROPIC)
+        assert msg.content[0]["cache_control"] == {"type": "ephemeral"}
+        assert cached_system_message("Be brief.", LLMProvider.OLLAMA).content == "Be brief."
+
+    def test_prompt_cache_key_only_for_official_openai(self):
+        """Compatible servers behind OPENAI_BASE_URL get no prompt_cache_key."""
+        llm = Mock()
+        enable_prompt_cache(llm, "key", LLMProvider.OPENAI)
+        llm.bind.assert_called_once_with(extra_body={"prompt_cache_key": "key"})
+
+        llm = Mock()
+        with patch.object(settings, "openai_base_url", "http://localhost:8080/v1"):
+            assert enable_prompt_cache(llm, "key", LLMProvider.OPENAI) is llm
+        llm.bind.assert_not_called()
+
 
 class TestLLMType:
     """Test LLM types."""
@@ -0,0 +1,45 @@
+"""Tests for the event loop helpers."""
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from multi_agent.shared.runtime import run_sync
+
+
+def test_run_sync_reuses_loop():
+    """Consecutive calls on one thread run on the same loop."""
+
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    assert run_sync(current_loop()) is run_sync(current_loop())
+
+
+def test_run_sync_from_several_threads():
+    """Concurrent calls from different threads don't share a loop."""
+    barrier = threading.Barrier(4)
+    results, errors = [], []
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return asyncio.get_running_loop()
+
+    def target():
+        barrier.wait()
+        try:
+            results.append(run_sync(work()))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=target) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors
+    assert len(set(map(id, results))) == 4
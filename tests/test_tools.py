@@ -8,6 +8,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from multi_agent.tools import (
     calculate,
+    evaluate_expression,
     get_current_time,
     web_search_mock,
     get_tools_for_agent,
@@ -33,6 +34,12 @@ class TestCalculateTool:
         result = calculate.invoke({"expression": "import os"})
         assert "Error" in result
 
+    def test_evaluate_expression(self):
+        """Test AST evaluator handles arithmetic and rejects other nodes."""
+        assert evaluate_expression("-(2 + 3) * 4 / 2") == -10
+        with pytest.raises(ValueError):
+            evaluate_expression("2 ** 8")
+
 
 class TestTimeTool:
     """Test time tool."""